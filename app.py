@@ -34,10 +34,13 @@ from compuzone import CompuzoneParser
 from guidecom import GuidecomParser
 from models import Product
 import re
-from concurrent.futures import ThreadPoolExecutor
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import time
 
+# ========== 가격 정렬용 패턴 (제품마다 re 캐시를 조회하지 않도록 미리 컴파일) ==========
+_NON_DIGITS_RE = re.compile(r'\D+')
+
 # ========== Streamlit 페이지 설정 ==========
 st.set_page_config(
     page_title="통합 상품 검색기",
@@ -138,6 +141,56 @@ def initialize_session_state():
 # 세션 상태 초기화 실행
 initialize_session_state()
 
+# ========== 사이트 병렬 호출 ==========
+# (사이트 이름, 세션에 저장된 파서 키) - 순서가 곧 결과 통합 순서
+SITE_PARSERS = (("컴퓨존", "compuzone_parser"), ("가이드컴", "guidecom_parser"))
+
+def iter_all_sites(method_name: str, task_label: str, *args) -> Iterator[Tuple[str, list]]:
+    """
+    모든 사이트 파서의 같은 메서드를 병렬로 호출하고, 끝나는 순서대로 결과를 내보냅니다.
+    
+    먼저 끝난 사이트 결과를 바로 받을 수 있어(as_completed) 화면 갱신을 가장 빠른
+    사이트 응답 시점부터 시작할 수 있습니다. 한 사이트가 실패하면 경고를 표시하고
+    빈 목록을 내보내 다른 사이트 결과는 유지합니다.
+    
+    Args:
+        method_name: 호출할 파서 메서드 이름 (예: "get_search_options")
+        task_label: 오류 메시지에 쓸 작업 이름 (예: "제조사 검색")
+        *args: 메서드에 넘길 인자
+        
+    Yields:
+        tuple: (사이트 이름, 결과 목록) - 완료 순서
+    """
+    with ThreadPoolExecutor(max_workers=len(SITE_PARSERS)) as executor:
+        futures = {
+            executor.submit(getattr(st.session_state[parser_key], method_name), *args): site
+            for site, parser_key in SITE_PARSERS
+        }
+        for future in as_completed(futures):
+            site = futures[future]
+            try:
+                result = future.result() or []
+            except Exception as e:
+                st.warning(f"{site} {task_label} 중 오류: {str(e)}")
+                result = []
+            yield site, result
+
+def run_on_all_sites(method_name: str, task_label: str, *args, status_container=None) -> Dict[str, list]:
+    """
+    iter_all_sites의 결과를 사이트별로 모아 반환합니다.
+    
+    status_container를 넘기면 사이트 하나가 끝날 때마다 진행 상황을 바로 표시합니다.
+    
+    Returns:
+        dict: {사이트 이름: 결과 목록} (SITE_PARSERS 순서)
+    """
+    results = {site: [] for site, _ in SITE_PARSERS}
+    for done, (site, result) in enumerate(iter_all_sites(method_name, task_label, *args), 1):
+        results[site] = result
+        if status_container is not None and done < len(SITE_PARSERS):
+            status_container.info(f"⏳ {site} {task_label} 완료 ({len(result)}개) - 나머지 사이트 기다리는 중...")
+    return results
+
 # ========== 1단계: 검색어 입력 폼 ==========
 def render_search_form():
     """
@@ -182,22 +235,10 @@ if search_button:
         
         with st.spinner("제조사 정보를 병렬로 가져오는 중... (컴퓨존 + 가이드컴)"):
             try:
-                compuzone_mfrs = []
-                guidecom_mfrs = []
-
-                with ThreadPoolExecutor(max_workers=2) as executor:
-                    future_compuzone = executor.submit(st.session_state.compuzone_parser.get_search_options, st.session_state.keyword)
-                    future_guidecom = executor.submit(st.session_state.guidecom_parser.get_search_options, st.session_state.keyword)
-
-                    try:
-                        compuzone_mfrs = future_compuzone.result() or []
-                    except Exception as e:
-                        st.warning(f"컴퓨존 제조사 검색 중 오류: {str(e)}")
-
-                    try:
-                        guidecom_mfrs = future_guidecom.result() or []
-                    except Exception as e:
-                        st.warning(f"가이드컴 제조사 검색 중 오류: {str(e)}")
+                site_mfrs = run_on_all_sites("get_search_options", "제조사 검색", st.session_state.keyword,
+                                             status_container=status_container)
+                compuzone_mfrs = site_mfrs["컴퓨존"]
+                guidecom_mfrs = site_mfrs["가이드컴"]
                 
                 # 제조사 통합 (각 사이트별 코드 보존)
                 all_mfrs = {}
@@ -302,22 +343,10 @@ elif st.session_state.manufacturers:
             
             with st.spinner('제품 정보를 병렬로 검색 중입니다... (컴퓨존 + 가이드컴)'):
                 try:
-                    compuzone_products = []
-                    guidecom_products = []
-
-                    with ThreadPoolExecutor(max_workers=2) as executor:
-                        future_compuzone = executor.submit(st.session_state.compuzone_parser.get_unique_products, st.session_state.keyword, selected_codes)
-                        future_guidecom = executor.submit(st.session_state.guidecom_parser.get_unique_products, st.session_state.keyword, selected_codes)
-
-                        try:
-                            compuzone_products = future_compuzone.result() or []
-                        except Exception as e:
-                            st.warning(f"컴퓨존 제품 검색 중 오류: {str(e)}")
-
-                        try:
-                            guidecom_products = future_guidecom.result() or []
-                        except Exception as e:
-                            st.warning(f"가이드컴 제품 검색 중 오류: {str(e)}")
+                    site_products = run_on_all_sites("get_unique_products", "제품 검색", st.session_state.keyword, selected_codes,
+                                                     status_container=product_status_container)
+                    compuzone_products = site_products["컴퓨존"]
+                    guidecom_products = site_products["가이드컴"]
                     
                     # 제품 통합
                     all_products = compuzone_products + guidecom_products
@@ -351,31 +380,29 @@ if st.session_state.products:
     # 가격순으로 정렬하기 위한 헬퍼 함수
     def extract_price(product):
         try:
-            # 정규식으로 숫자만 추출 (더 효율적)
-            price_digits = re.sub(r'[^\d]', '', product.price)
+            # 미리 컴파일한 정규식으로 숫자만 추출 (연속된 비숫자를 한 번에 제거)
+            price_digits = _NON_DIGITS_RE.sub('', product.price)
             return int(price_digits) if price_digits else float('inf')
         except (ValueError, AttributeError):
             # 변환 불가능한 경우, 맨 뒤로 정렬
             return float('inf')
 
-    # 최저가 찾기 (가격이 숫자인 제품들만)
-    valid_prices = []
-    for product in st.session_state.products:
-        price_num = extract_price(product)
-        if price_num != float('inf'):
-            valid_prices.append(price_num)
+    # 제품마다 가격 숫자를 한 번만 계산해서 최저가 판별/정렬/표시에 재사용
+    priced_products = [(extract_price(product), product) for product in st.session_state.products]
     
+    # 최저가 찾기 (가격이 숫자인 제품들만)
+    valid_prices = [price_num for price_num, _ in priced_products if price_num != float('inf')]
     min_price = min(valid_prices) if valid_prices else None
     
-    # 제품 목록을 가격 오름차순으로 정렬
-    sorted_products = sorted(st.session_state.products, key=extract_price)
+    # 제품 목록을 가격 오름차순으로 정렬 (같은 가격은 기존 순서 유지)
+    sorted_products = sorted(priced_products, key=lambda item: item[0])
     
     # 사이트별 카운터
     site_counters = {"컴퓨존": 0, "가이드컴": 0}
     
     # 데이터프레임 생성
     data = []
-    for i, p in enumerate(sorted_products):
+    for i, (price_num, p) in enumerate(sorted_products):
         # 사이트 정보 안전 처리
         site_name = getattr(p, 'site', '') or "컴퓨존"  # 기본값은 컴퓨존
         if site_name not in site_counters:
@@ -386,7 +413,6 @@ if st.session_state.products:
         site_link_num = site_counters[site_name]
         
         # 최저가 표시
-        price_num = extract_price(p)
         is_lowest = min_price and price_num == min_price and price_num != float('inf')
         price_display = f"💰 {p.price}" if is_lowest else p.price
         
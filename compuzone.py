@@ -28,12 +28,157 @@
 
 # -*- coding: utf-8 -*-
 import requests
+import soupsieve as sv
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import re
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+import time
+from bs4 import BeautifulSoup, FeatureNotFound
+from collections import Counter, OrderedDict
+from types import MappingProxyType
+from typing import List, Dict, Optional, Pattern, Tuple
 import urllib.parse
 from models import Product
 
+# ========== 정규식 (모듈 로드 시 한 번만 컴파일) ==========
+_NON_DIGIT_RE = re.compile(r'[^\d]')                      # 가격에서 숫자 외 문자 제거
+_WS_RE = re.compile(r'\s+')                               # 연속 공백 정리
+_BRACKET_RE = re.compile(r'\[([^\]]+)\]')                 # [브랜드] 형식
+_PAREN_RE = re.compile(r'\(([^)]+)\)')                    # 옵션명의 (사양) 부분
+_COUNT_SUFFIX_RE = re.compile(r'\s*\(\d+\)\s*$')           # 라벨 끝의 "(12)" 같은 개수 표기
+_CAPACITY_PATTERNS = (                                    # 검색어 용량 (단위 우선순위 순)
+    re.compile(r'(\d+)\s*TB'),
+    re.compile(r'(\d+)\s*GB'),
+    re.compile(r'(\d+)\s*MB'),
+)
+_SIZE_UNIT_RE = re.compile(r'(\d+)\s*(TB|GB|MB)')          # 용량 필터 숫자/단위 분리
+_NAME_CAPACITY_RE = re.compile(r'(\d+[KMGT]?B)')          # 제품명 용량
+# 제품 시리즈 / 메모리 타입: 패턴마다 그룹 하나씩 둔 단일 정규식 (그룹 번호 = 우선순위)
+# 한 번 스캔하고 가장 우선순위가 높은 그룹을 고르므로 패턴별로 여러 번 검색한 것과 결과가 같음
+_SERIES_RE = re.compile(r'(RTX \d+)|(GTX \d+)|(RX \d+)|(ARC A\d+)|(I\d-\d+K?F?)|(RYZEN \d+ \d+X?)')
+_MEMORY_TYPE_RE = re.compile(r'(DDR5)|(DDR4)|(GDDR6X)|(GDDR6)|(HBM3)|(HBM2)')
+_CAPACITY_UNIT_RE = re.compile(r'(\d+)\s*([KMGT]?B?)')    # 사양 중복 판별용 용량
+_SERIES_SHORT_RE = re.compile(r'(RTX|GTX|RX|ARC)\s*(\d+)') # 사양 중복 판별용 시리즈
+# 표기 포함 여부 (단어 경계 없이 부분 문자열 기준 - "RTX4070", "12gb" 같은 붙여쓰기도 매칭)
+_GPU_MARKER_RE = re.compile(r'RTX|GTX|RX|RADEON|GEFORCE')           # 용량을 VRAM으로 표시할 GPU 제품
+_MEMORY_MARKER_RE = re.compile(r'vram|memory|메모리|gb|tb')          # 용량 중복으로 볼 메모리/저장 표기 (소문자 기준)
+_ALL_DIGITS_RE = re.compile(r'^\d+$')
+_HANGUL_ONLY_RE = re.compile(r'^[가-힣]+$')
+_GENERIC_TERM_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'신.*품',     # 신상품, 신제품 등
+    r'.*가격',     # 최저가격, 할인가격 등
+    r'.*배송',     # 무료배송, 빠른배송 등
+    r'.*발송',     # 당일발송, 즉시발송 등
+    r'.*특가',     # 할인특가 등
+    r'.*이벤트',   # 특별이벤트 등
+    r'.*세일',     # 연말세일 등
+    r'\d+.*월',    # 날짜 표현
+    r'오전|오후|시간|분|초',  # 시간 표현
+))
+
+# ========== 상품 요소 CSS 선택자 (모듈 로드 시 한 번만 컴파일, 상품마다 다시 파싱하지 않음) ==========
+_ITEM_NAME_SEL = sv.compile(".prd_info_name.prdTxt, .prd_info_name")
+_ITEM_LINK_SEL = sv.compile(".prd_info_name")
+_OPTION_WRAP_SEL = sv.compile(".prd_option_wrap")
+_OPTION_SEL = sv.compile(".prd_option")
+_OP_NAME_SEL = sv.compile(".op_name")                      # HDD 타입 옵션명
+_OPT_NAME_SEL = sv.compile(".opt_name")                    # SSD 타입 옵션명 / 세부 옵션명
+_OP_LIST_AREA_SEL = sv.compile(".op_list_area")
+_OP_LIST_SEL = sv.compile(".op_list")
+_GROUP_PRODUCT_NO_SEL = sv.compile(".SelGroupProductNo")
+_SUB_PRICE_SEL = sv.compile(".op_price .f_black")
+_OPTION_PRICE_SEL = sv.compile(".op_price .f_black, .op_price span")
+_SUB_TXT_SEL = sv.compile(".prd_subTxt")
+_PRD_INFO_SEL = sv.compile(".prd_info")
+_PRICE_SELECTORS = tuple(sv.compile(selector) for selector in (   # 우선순위 순
+    ".prd_price .number",
+    ".prd_price .price",
+    ".price_sect .number",
+    ".price .number",
+    ".prd_price",
+))
+
+# ========== 제조사 ID/별칭 매핑 (호출마다 dict를 새로 만들지 않도록 모듈 상수로 고정) ==========
+# 각 매핑은 출처가 달라 같은 브랜드라도 ID가 다를 수 있으므로 (예: ASUS '9' / '100')
+# 하나로 합치지 않고 기존 값 그대로 분리해 둠
+# 브랜드 별칭 그룹: 선택된 코드가 그룹에 있으면 같은 그룹의 다른 표기도 매칭
+_BRAND_ALIAS_MAP = MappingProxyType({
+    'amd': ['amd', '라이젠', 'ryzen'],
+    'intel': ['intel', '인텔', '코어', 'core'],
+    'samsung': ['삼성', 'samsung', '삼성전자'],
+    'nvidia': ['nvidia', '지포스', 'geforce', 'rtx', 'gtx'],
+    'asus': ['asus', '에이수스'],
+    'msi': ['msi'],
+    'gigabyte': ['gigabyte', '기가바이트'],
+    'western digital': ['wd', 'western digital', '웨스턴디지털'],
+    'seagate': ['seagate', '시게이트'],
+})
+
+# 컴퓨존 제조사 ID → 브랜드명 (사이트 분석으로 확인된 매핑)
+_BRAND_ID_MAPPING = MappingProxyType({
+    # 주요 CPU 브랜드
+    '8': 'AMD',                            # AMD 프로세서 (라이젠 등)
+    '1': 'INTEL',                          # 인텔 프로세서
+
+    # 주요 저장장치 브랜드
+    '2': '삼성전자', '6202': '삼성전자',
+    '24': 'Western Digital', '25': 'SEAGATE',
+    '6348': 'Crucial', '18': 'Kingston', '242': 'Transcend',
+    '3400': 'ADATA', '20': '마이크론', '566': '하이디스크',
+    '6549': '티맥스솔루션', '14948': 'SK hynix',
+
+    # 주요 그래픽카드 브랜드
+    '14': 'GIGABYTE', '9': 'ASUS', '475': 'MSI',
+    '1111': 'PNY', '8842': 'PALIT', '2416': 'ZOTAC',
+    '6238': 'INNO3D', '32': 'GAINWARD', '3169': 'MANLI',
+
+    # 기타 PC부품 브랜드
+    '99': 'HP', '763': 'Corsair', '1046': 'Patriot',
+    '1419': 'G.SKILL', '4629': '레노버'
+})
+
+# 키워드별 기본 제조사 목록용 브랜드명 → ID
+_KNOWN_MANUFACTURER_IDS = MappingProxyType({
+    '삼성전자': '2',
+    'HP': '99',
+    '레노버': '4629',
+    # 추가 제조사들 (추정)
+    'LG전자': '3',
+    'ASUS': '100',
+    'MSI': '101',
+    'GIGABYTE': '102',
+    'Western Digital': '200',
+    'Seagate': '201',
+    'Kingston': '300',
+    'Crucial': '301',
+    'INTEL': '400',
+    'AMD': '401',
+})
+
+# 제품 브랜드명 → 제조사 ID (API에서 못 찾았을 때 사용)
+_KNOWN_BRAND_IDS = MappingProxyType({
+    '삼성전자': '2', 'HP': '99', '레노버': '4629',
+    'Western Digital': '24', 'SEAGATE': '25', 'ADATA': '3400',
+    '동화': '439', 'SEBAP': '10219', 'HPE': '15947'
+})
+
+# 검색 결과 [브랜드] → 제조사 ID (없으면 브랜드명을 코드로 사용)
+_SEARCH_RESULT_BRAND_IDS = MappingProxyType({
+    'SEBAP': '10219', 'Western Digital': '24', '동화': '439',
+    'SEAGATE': '25', 'HPE': '15947', '삼성전자': '2',
+    'HP': '99', '레노버': '4629', 'ASUS': '9', 'MSI': '475',
+    'GIGABYTE': '14', 'ADATA': '3400', 'Crucial': '6348',
+    'Kingston': '18', 'Corsair': '763', 'G.SKILL': '1419',
+    '지스킬': '1419', 'TeamGroup': '1419', 'TEAMGROUP': '1419',
+    'CORSAIR': '763', 'Patriot': '1046', 'KINGMAX': '18',
+    # HTML 체크박스에서 확인된 그래픽카드 제조사들
+    'MANLI': '3169', 'PNY': '1111', 'PALIT': '8842',
+    'ZOTAC': '2416', 'Thermal grizzly': '8231', 'INNO3D': '6238',
+    'GAINWARD': '32'
+})
+
+
 class CompuzoneParser:
     """
     컴퓨존 웹사이트 파서 클래스
@@ -66,14 +211,59 @@ class CompuzoneParser:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',  # 한국어 우선
-            'Accept-Encoding': 'gzip, deflate, br',
+            # 설치된 디코더 기준(brotli 미설치 시 br 제외) - 해제 못 하는 br 응답을 받지 않도록
+            'Accept-Encoding': DEFAULT_ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         })
         
+        # 연결 재사용(페이지 방문과 API 호출이 같은 keep-alive 연결 공유) + 일시적 서버 오류 재시도
+        # raise_on_status=False: 재시도 후에도 실패하면 마지막 응답을 그대로 돌려 기존 상태 코드 검사에 맡김
+        # read=False: 읽기 타임아웃까지 재시도하면 한 요청이 타임아웃의 몇 배로 늘어나므로 제외
+        retry = Retry(
+            total=2,
+            read=False,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
         # 컴퓨존 URL 설정
         self.base_url = "https://www.compuzone.co.kr/search/search.htm"          # 메인 검색 페이지
         self.search_api_url = "https://www.compuzone.co.kr/search/search_list.php"  # 검색 결과 API
+        
+        # 검색 API 응답 캐시: 정렬된 파라미터 → (저장 시각, 응답 본문 바이트)
+        # 같은 검색어/정렬을 다시 검색하면 5분 동안은 네트워크 요청 없이 재사용
+        # (Response 객체 대신 파싱에 필요한 본문만 보관 - 헤더/요청/연결 객체는 붙잡지 않음)
+        self._api_cache: "OrderedDict[Tuple[Tuple[str, str], ...], Tuple[float, bytes]]" = OrderedDict()
+        self._api_cache_ttl = 300.0       # 초 (가격 변동을 고려한 유효 시간)
+        self._api_cache_size = 64         # 최대 보관 응답 수
+        
+        # 검색 페이지 방문(쿠키 설정)은 세션당 한 번이면 충분 - 성공 후에는 API만 호출
+        self._warmed_up = False
+        
+        # 제조사 목록 캐시: 검색어 → (저장 시각, 제조사 목록)
+        # 제조사 조회 후 같은 검색어로 다시 조회할 때 API 호출/제품 파싱을 반복하지 않도록
+        self._options_cache: "OrderedDict[str, Tuple[float, List[Dict[str, str]]]]" = OrderedDict()
+        self._options_cache_ttl = 300.0
+        self._options_cache_size = 64
+
+    def _make_soup(self, content: bytes) -> BeautifulSoup:
+        """
+        응답 바이트(resp.content)를 그대로 lxml에 넘겨 파싱합니다 (resp.text 디코딩 단계 생략).
+        
+        컴퓨존은 EUC-KR로 선언하지만 CP949 확장 한글이 섞일 수 있고, libxml2는
+        'euc-kr'로 지정하면 그런 문자에서 문서 전체를 버리므로 상위 집합인 cp949로 지정합니다.
+        인코딩은 여기서 고정하므로 호출부에서 resp.encoding을 설정할 필요가 없습니다.
+        lxml이 없는 환경에서는 html.parser로 대체합니다.
+        """
+        try:
+            return BeautifulSoup(content, 'lxml', from_encoding='cp949')
+        except FeatureNotFound:
+            return BeautifulSoup(content, 'html.parser', from_encoding='cp949')
 
     def _format_price(self, price_text: str) -> str:
         """
@@ -96,7 +286,7 @@ class CompuzoneParser:
             return "가격 정보 없음"
         
         # 숫자만 추출
-        price_clean = re.sub(r'[^\d]', '', price_text)
+        price_clean = _NON_DIGIT_RE.sub('', price_text)
         if price_clean:
             try:
                 return f"{int(price_clean):,}원"
@@ -109,7 +299,28 @@ class CompuzoneParser:
         
         return price_text
     
-    def _check_brand_match(self, product_name: str, maker_codes: List[str]) -> bool:
+    def _prepare_maker_codes(self, maker_codes: List[str]) -> Optional[Pattern]:
+        """
+        선택된 제조사 코드로 통과 조건이 되는 모든 용어를 모아 정규식 하나로 컴파일 (검색당 한 번)
+        
+        용어: 정리된 코드 자체 + 코드가 속한 별칭 그룹의 모든 표기.
+        코드가 없으면 None (필터 없음).
+        """
+        if not maker_codes:
+            return None
+        
+        terms = set()
+        for code in maker_codes:
+            code_lower = code.lower().replace("_", " ").strip()
+            terms.add(code_lower)
+            for aliases in _BRAND_ALIAS_MAP.values():
+                if code_lower in aliases:
+                    terms.update(aliases)
+        
+        # 긴 용어를 앞에 두어 겹치는 별칭에서도 자연스럽게 매칭 (결과는 포함 여부만 사용)
+        return re.compile("|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)))
+    
+    def _check_brand_match(self, product_name: str, maker_matcher: Optional[Pattern]) -> bool:
         """
         제품명 기반 간단한 브랜드 매칭 시스템
         
@@ -120,54 +331,17 @@ class CompuzoneParser:
         
         Args:
             product_name (str): 제품명 (예: "[삼성전자] 990 EVO 1TB")
-            maker_codes (List[str]): 선택된 제조사 코드 목록
+            maker_matcher: _prepare_maker_codes()로 미리 컴파일한 용어 정규식 (None이면 필터 없음)
             
         Returns:
             bool: 매칭 성공 시 True, 실패 시 False
         """
-        if not maker_codes:
+        if maker_matcher is None:
             return True
-            
-        product_name_lower = product_name.lower()
         
-        # 핵심 로직: 제품명에 선택된 제조사 중 하나라도 포함되면 통과
-        for code in maker_codes:
-            code_lower = code.lower().replace("_", " ").strip()
-            
-            # 1. 직접 매칭: 제조사명이 제품명에 포함
-            if code_lower in product_name_lower:
-                return True
-            
-            # 2. 브랜드 별칭 매칭: 다양한 표기법 지원
-            if self._check_brand_aliases(product_name_lower, code_lower):
-                return True
-        
-        return False
+        # 핵심 로직: 제조사명/별칭 중 하나라도 제품명에 포함되면 통과 (한 번의 스캔)
+        return maker_matcher.search(product_name.lower()) is not None
     
-    def _check_brand_aliases(self, product_name_lower: str, code_lower: str) -> bool:
-        """브랜드 별칭을 확인하여 매칭"""
-        # 간단한 별칭 매핑 (가장 중요한 것만)
-        alias_map = {
-            'amd': ['amd', '라이젠', 'ryzen'],
-            'intel': ['intel', '인텔', '코어', 'core'],
-            'samsung': ['삼성', 'samsung', '삼성전자'],
-            'nvidia': ['nvidia', '지포스', 'geforce', 'rtx', 'gtx'],
-            'asus': ['asus', '에이수스'],
-            'msi': ['msi'],
-            'gigabyte': ['gigabyte', '기가바이트'],
-            'western digital': ['wd', 'western digital', '웨스턴디지털'],
-            'seagate': ['seagate', '시게이트'],
-        }
-        
-        for brand_key, aliases in alias_map.items():
-            if code_lower in aliases:
-                # 제품명에 같은 그룹의 다른 별칭이 있는지 확인
-                for alias in aliases:
-                    if alias in product_name_lower:
-                        return True
-        
-        return False
-        
     def _get_brand_mapping(self) -> dict:
         """
         컴퓨존에서 사용하는 제조사 ID와 브랜드명 매핑을 반환합니다.
@@ -179,27 +353,7 @@ class CompuzoneParser:
             dict: {제조사_ID: 브랜드명} 형태의 매핑 딕셔너리
                  예: {'2': '삼성전자', '24': 'Western Digital'}
         """
-        return {
-            # 주요 CPU 브랜드
-            '8': 'AMD',                            # AMD 프로세서 (라이젠 등)
-            '1': 'INTEL',                          # 인텔 프로세서
-            
-            # 주요 저장장치 브랜드
-            '2': '삼성전자', '6202': '삼성전자',
-            '24': 'Western Digital', '25': 'SEAGATE',
-            '6348': 'Crucial', '18': 'Kingston', '242': 'Transcend',
-            '3400': 'ADATA', '20': '마이크론', '566': '하이디스크',
-            '6549': '티맥스솔루션', '14948': 'SK hynix',
-            
-            # 주요 그래픽카드 브랜드  
-            '14': 'GIGABYTE', '9': 'ASUS', '475': 'MSI',
-            '1111': 'PNY', '8842': 'PALIT', '2416': 'ZOTAC',
-            '6238': 'INNO3D', '32': 'GAINWARD', '3169': 'MANLI',
-            
-            # 기타 PC부품 브랜드
-            '99': 'HP', '763': 'Corsair', '1046': 'Patriot',
-            '1419': 'G.SKILL', '4629': '레노버'
-        }
+        return dict(_BRAND_ID_MAPPING)
         
     def _brands_match(self, brand1: str, brand2: str) -> bool:
         """두 브랜드명이 같은지 비교 (대소문자 및 공백 무시)"""
@@ -270,10 +424,9 @@ class CompuzoneParser:
             }
             
             resp = self.session.get(self.search_api_url, params=params, headers=headers, timeout=10)
-            resp.encoding = 'euc-kr'
             resp.raise_for_status()
             
-            soup = BeautifulSoup(resp.text, 'html.parser')
+            soup = self._make_soup(resp.content)
             
             # 제조사 체크박스 추출
             checkbox_selectors = [
@@ -309,7 +462,7 @@ class CompuzoneParser:
                                     if label:
                                         label_text = label.get_text(strip=True)
                                         # 괄호와 숫자 제거
-                                        brand_name = re.sub(r'\s*\(\d+\)\s*$', '', label_text)
+                                        brand_name = _COUNT_SUFFIX_RE.sub('', label_text)
                             
                             if brand_name:
                                 manufacturers.append({'name': brand_name, 'code': vals})
@@ -326,24 +479,7 @@ class CompuzoneParser:
     
     def _get_known_manufacturer_ids(self, keyword: str) -> List[Dict[str, str]]:
         """알려진 제조사 ID 매핑을 반환합니다."""
-        # 제공받은 분석 자료에서 확인된 제조사 ID들
-        known_manufacturers = {
-            '삼성전자': '2',
-            'HP': '99',
-            '레노버': '4629',
-            # 추가 제조사들 (추정)
-            'LG전자': '3',
-            'ASUS': '100',
-            'MSI': '101',
-            'GIGABYTE': '102',
-            'Western Digital': '200',
-            'Seagate': '201',
-            'Kingston': '300',
-            'Crucial': '301',
-            'INTEL': '400',
-            'AMD': '401',
-        }
-        
+        # 제공받은 분석 자료에서 확인된 제조사 ID들 (_KNOWN_MANUFACTURER_IDS)
         manufacturers = []
         
         # 키워드에 따라 관련 제조사들만 반환
@@ -363,11 +499,11 @@ class CompuzoneParser:
             relevant_brands = ['삼성전자', 'LG전자', 'HP', '레노버', 'ASUS']
         else:
             # 일반적인 제조사들
-            relevant_brands = list(known_manufacturers.keys())[:10]
+            relevant_brands = list(_KNOWN_MANUFACTURER_IDS)[:10]
         
         for brand in relevant_brands:
-            if brand in known_manufacturers:
-                manufacturers.append({'name': brand, 'code': known_manufacturers[brand]})
+            if brand in _KNOWN_MANUFACTURER_IDS:
+                manufacturers.append({'name': brand, 'code': _KNOWN_MANUFACTURER_IDS[brand]})
         
         return manufacturers
 
@@ -380,7 +516,6 @@ class CompuzoneParser:
             
             # 검색 페이지 접근
             resp = self.session.get(search_url, timeout=10)
-            resp.encoding = 'utf-8'
             resp.raise_for_status()
             
             # API 호출로 실제 제품 목록 가져오기 (컴퓨터부품 카테고리로 제한)
@@ -409,10 +544,9 @@ class CompuzoneParser:
             }
             
             resp = self.session.get(self.search_api_url, params=params, headers=headers, timeout=10)
-            resp.encoding = 'euc-kr'
             resp.raise_for_status()
             
-            soup = BeautifulSoup(resp.text, 'html.parser')
+            soup = self._make_soup(resp.content)
             
             # 제품 아이템에서 제조사 추출
             product_items = soup.select("li.li-obj")
@@ -421,12 +555,12 @@ class CompuzoneParser:
             print(f"실제 검색된 제품 수: {len(product_items)}개")
             
             for item in product_items:
-                product_name_tag = item.select_one(".prd_info_name.prdTxt, .prd_info_name")
+                product_name_tag = _ITEM_NAME_SEL.select_one(item)
                 if product_name_tag:
                     product_name = product_name_tag.get_text(strip=True)
                     
                     # [브랜드] 형식에서 브랜드 추출
-                    bracket_brand_match = re.search(r'\[([^\]]+)\]', product_name)
+                    bracket_brand_match = _BRACKET_RE.search(product_name)
                     if bracket_brand_match:
                         brand_name = bracket_brand_match.group(1)
                         
@@ -460,13 +594,7 @@ class CompuzoneParser:
                     return mfr['code']
             
             # 알려진 제조사 매핑에서도 찾기
-            known_mapping = {
-                '삼성전자': '2', 'HP': '99', '레노버': '4629',
-                'Western Digital': '24', 'SEAGATE': '25', 'ADATA': '3400',
-                '동화': '439', 'SEBAP': '10219', 'HPE': '15947'
-            }
-            
-            return known_mapping.get(brand_name)
+            return _KNOWN_BRAND_IDS.get(brand_name)
             
         except Exception as e:
             print(f"브랜드 {brand_name}의 ID 찾기 실패: {e}")
@@ -479,63 +607,64 @@ class CompuzoneParser:
             products = self.search_products(keyword, "sale_order", [], limit=50)
             
             # 제품명에서 브랜드 추출
-            brands_found = {}  # {브랜드명: 개수} 형태로 저장
+            brands_found = Counter()  # {브랜드명: 개수} 형태로 저장
             
             print(f"검색된 제품 수: {len(products)}개")
             
             for product in products:
                 # [브랜드] 형식 추출
-                bracket_match = re.search(r'\[([^\]]+)\]', product.name)
+                bracket_match = _BRACKET_RE.search(product.name)
                 if bracket_match:
                     brand_name = bracket_match.group(1).strip()
                     if len(brand_name) > 1:  # 너무 짧은 것 제외
-                        brands_found[brand_name] = brands_found.get(brand_name, 0) + 1
+                        brands_found[brand_name] += 1
                         if len(brands_found) <= 5:  # 처음 5개만 디버그 출력
                             print(f"  브랜드 발견: [{brand_name}] from {product.name[:40]}...")
             
-            # 알려진 제조사 ID 매핑 (더 포괄적으로)
-            known_ids = {
-                'SEBAP': '10219', 'Western Digital': '24', '동화': '439', 
-                'SEAGATE': '25', 'HPE': '15947', '삼성전자': '2', 
-                'HP': '99', '레노버': '4629', 'ASUS': '9', 'MSI': '475',
-                'GIGABYTE': '14', 'ADATA': '3400', 'Crucial': '6348',
-                'Kingston': '18', 'Corsair': '763', 'G.SKILL': '1419',
-                '지스킬': '1419', 'TeamGroup': '1419', 'TEAMGROUP': '1419',
-                'CORSAIR': '763', 'Patriot': '1046', 'KINGMAX': '18',
-                # HTML 체크박스에서 확인된 그래픽카드 제조사들
-                'MANLI': '3169', 'PNY': '1111', 'PALIT': '8842',
-                'ZOTAC': '2416', 'Thermal grizzly': '8231', 'INNO3D': '6238',
-                'GAINWARD': '32'
-            }
-            
-            # 제품 개수 기준으로 정렬 (실제로 많이 나오는 브랜드 우선)
-            sorted_brands = sorted(brands_found.items(), key=lambda x: x[1], reverse=True)
+            # 제품 개수 기준 상위 12개만 (실제로 많이 나오는 브랜드 우선, 동률은 발견 순서)
+            # 알려진 ID가 있으면 사용, 없으면 브랜드명을 ID로 사용
+            top_brands = brands_found.most_common(12)
+            result = [{'name': brand_name, 'code': _SEARCH_RESULT_BRAND_IDS.get(brand_name, brand_name)}
+                      for brand_name, _ in top_brands]
             
-            # 결과 생성
-            result = []
-            for brand_name, count in sorted_brands:
-                # 알려진 ID가 있으면 사용, 없으면 브랜드명을 ID로 사용
-                brand_id = known_ids.get(brand_name, brand_name)
-                result.append({'name': brand_name, 'code': brand_id})
-            
-            print(f"실제 제품에서 추출한 브랜드: {len(result)}개")
-            for brand in result[:10]:  # 처음 10개만 표시
-                count = brands_found[brand['name']]
+            print(f"실제 제품에서 추출한 브랜드: {len(brands_found)}개")
+            for brand, (_, count) in zip(result[:10], top_brands):  # 처음 10개만 표시
                 print(f"  - {brand['name']} (ID: {brand['code']}) - {count}개 제품")
             
-            return result[:12]  # 최대 12개까지
+            return result
             
         except Exception as e:
             print(f"브랜드 추출 실패: {e}")
             return []
 
+    def _cached_search_options(self, keyword: str) -> Optional[List[Dict[str, str]]]:
+        """유효 시간 안에 저장된 제조사 목록의 복사본 (없으면 None)"""
+        cached = self._options_cache.get(keyword)
+        if not cached or time.monotonic() - cached[0] >= self._options_cache_ttl:
+            return None
+        self._options_cache.move_to_end(keyword)
+        return [dict(option) for option in cached[1]]
+
+    def _store_search_options(self, keyword: str, options: List[Dict[str, str]]) -> None:
+        """실제로 찾은 제조사 목록만 저장 (호출자가 결과를 고쳐도 캐시는 그대로 유지되도록 복사)"""
+        self._options_cache[keyword] = (time.monotonic(), [dict(option) for option in options])
+        self._options_cache.move_to_end(keyword)
+        while len(self._options_cache) > self._options_cache_size:
+            self._options_cache.popitem(last=False)
+
     def get_search_options(self, keyword: str) -> List[Dict[str, str]]:
         """컴퓨존에서 검색 결과를 통해 브랜드를 추출합니다."""
+        cached = self._cached_search_options(keyword)
+        if cached is not None:
+            print(f"캐시된 제조사 목록 사용: {len(cached)}개")
+            return cached
+        
         try:
             # 1단계: API에서 직접 제조사 정보 가져오기 (가장 빠름)
             manufacturers = self._get_manufacturer_from_search_api(keyword)
             if manufacturers:
                 print(f"API를 통해 제조사 {len(manufacturers)}개 즉시 확인")
+                self._store_search_options(keyword, manufacturers)
                 return manufacturers
 
             # 2단계: API 실패 시, 실제 제품 목록에서 브랜드 추출 (느리지만 정확)
@@ -543,9 +672,11 @@ class CompuzoneParser:
             manufacturers_from_products = self._extract_brands_from_search_results(keyword)
             if manufacturers_from_products:
                 print(f"실제 제품에서 제조사 {len(manufacturers_from_products)}개 추출 성공")
+                self._store_search_options(keyword, manufacturers_from_products)
                 return manufacturers_from_products
             
             # 3단계: 그래도 없으면, 알려진 제조사 ID 목록 반환 (최후의 수단)
+            # (실제 데이터가 아니므로 캐시하지 않음 - 다음 조회에서 다시 시도)
             print("최종 수단: 알려진 제조사 ID 목록 반환")
             return self._get_known_manufacturer_ids(keyword)
             
@@ -556,7 +687,6 @@ class CompuzoneParser:
             
             # 먼저 검색 페이지에 접근
             resp = self.session.get(search_url, timeout=10)
-            resp.encoding = 'euc-kr'  # 컴퓨존은 EUC-KR 인코딩 사용
             resp.raise_for_status()
             
             # 검색 결과 목록 가져오기
@@ -584,10 +714,9 @@ class CompuzoneParser:
             }
             
             resp = self.session.get(self.search_api_url, params=params, headers=headers, timeout=10)
-            resp.encoding = 'euc-kr'  # 컴퓨존은 EUC-KR 인코딩 사용
             resp.raise_for_status()
             
-            soup = BeautifulSoup(resp.text, 'html.parser')
+            soup = self._make_soup(resp.content)
             
             # 제품명에서 브랜드 추출
             product_items = soup.select("li.li-obj")
@@ -617,7 +746,7 @@ class CompuzoneParser:
                     product_name = product_name_tag.get_text(strip=True)
                     
                     # 컴퓨존의 [브랜드] 형식 추출
-                    bracket_brand_match = re.search(r'\[([^\]]+)\]', product_name)
+                    bracket_brand_match = _BRACKET_RE.search(product_name)
                     if bracket_brand_match:
                         bracket_brand = bracket_brand_match.group(1)
                         brands.add(bracket_brand)
@@ -668,20 +797,19 @@ class CompuzoneParser:
             search_url = f"{self.base_url}?SearchProductKey={encoded_keyword}"
             print(f"검색 URL: {search_url}")
             
-            # 메인 검색 페이지 방문: 쿠키 설정 및 세션 초기화를 위해 필요
-            try:
-                resp = self.session.get(search_url, timeout=10)
-                resp.encoding = 'euc-kr'  # 컴퓨존은 EUC-KR 인코딩 사용
-                resp.raise_for_status()
-                print(f"[OK] 검색 페이지 접근 성공 (상태코드: {resp.status_code})")
-            except Exception as e:
-                print(f"[ERROR] 검색 페이지 접근 실패: {e}")
-                return []
-            
             # ========== 2단계: 다중 검색 전략 정의 ==========
             # 실제 사이트 분석 결과를 바탕으로 3가지 검색 전략을 순차적으로 시도
             search_strategies = self._build_search_strategies(keyword, sort_type)
-            
+            headers = self._build_api_headers(search_url)
+
+            # 제조사 필터는 상품마다가 아니라 검색당 한 번만 준비
+            maker_matcher = self._prepare_maker_codes(maker_codes)
+
+            # 메인 검색 페이지 방문(쿠키 설정/세션 초기화)을 API 호출보다 먼저 끝내야 함
+            # (쿠키 없이 받은 응답이 API 캐시에 남지 않도록). 이미 방문한 세션이면 생략
+            if not self._warmed_up and not self._visit_search_page(search_url):
+                return []
+
             all_products = []
             successful_strategy = None
             
@@ -691,23 +819,20 @@ class CompuzoneParser:
                     strategy_name = strategy.pop("name")  # 'name' 키는 로깅용, API 호출에서 제외
                     print(f"\n--- 검색 전략 {strategy_index}: '{strategy_name}' 시도 중 ---")
                     
-                    # API 호출을 위한 HTTP 헤더 설정
-                    headers = self._build_api_headers(search_url)
-                    
                     # 실제 API 호출 수행
-                    resp = self._call_search_api(strategy, headers)
-                    if not resp:
+                    body = self._call_search_api(strategy, headers)
+                    if not body:
                         print(f"[ERROR] 전략 '{strategy_name}': API 호출 실패")
                         continue
                     
                     # HTML 파싱 및 상품 요소 추출
-                    product_items = self._extract_product_elements(resp, strategy_name)
+                    product_items = self._extract_product_elements(body, strategy_name)
                     if not product_items:
                         print(f"[ERROR] 전략 '{strategy_name}': 상품 요소를 찾을 수 없음")
                         continue
                     
                     # 개별 상품 파싱 및 필터링
-                    parsed_products = self._parse_all_products(product_items, maker_codes, keyword, limit)
+                    parsed_products = self._parse_all_products(product_items, maker_matcher, keyword, limit)
                     
                     if parsed_products:
                         all_products = parsed_products
@@ -730,6 +855,24 @@ class CompuzoneParser:
             traceback.print_exc()
             return []
 
+    def _visit_search_page(self, search_url: str) -> bool:
+        """
+        메인 검색 페이지를 방문해 쿠키를 설정하고 세션을 초기화합니다.
+        성공하면 _warmed_up을 세워 같은 세션의 다음 검색에서는 방문을 생략합니다.
+        
+        Returns:
+            bool: 접근 성공 시 True, 실패 시 False
+        """
+        try:
+            resp = self.session.get(search_url, timeout=10)
+            resp.raise_for_status()
+            print(f"[OK] 검색 페이지 접근 성공 (상태코드: {resp.status_code})")
+            self._warmed_up = True
+            return True
+        except Exception as e:
+            print(f"[ERROR] 검색 페이지 접근 실패: {e}")
+            return False
+
     def _build_search_strategies(self, keyword: str, sort_type: str) -> List[Dict]:
         """
         검색 전략 리스트를 구성합니다.
@@ -815,7 +958,7 @@ class CompuzoneParser:
             "User-Agent": self.session.headers.get('User-Agent', '')  # 기존 User-Agent 유지
         }
 
-    def _call_search_api(self, params: Dict, headers: Dict) -> Optional[requests.Response]:
+    def _call_search_api(self, params: Dict, headers: Dict) -> Optional[bytes]:
         """
         실제 검색 API를 호출합니다.
         
@@ -824,8 +967,15 @@ class CompuzoneParser:
             headers: HTTP 헤더 딕셔너리
             
         Returns:
-            requests.Response 또는 None (실패시)
+            bytes: 응답 본문 (상태 200이고 충분한 크기일 때만), 실패시 None
         """
+        cache_key = tuple(sorted((str(k), str(v)) for k, v in params.items()))
+        cached = self._api_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self._api_cache_ttl:
+            self._api_cache.move_to_end(cache_key)
+            print(f"   [OK] 캐시된 API 응답 사용 (응답 크기: {len(cached[1])}바이트)")
+            return cached[1]
+        
         try:
             resp = self.session.get(
                 self.search_api_url,        # https://www.compuzone.co.kr/search/search_list.php
@@ -833,37 +983,45 @@ class CompuzoneParser:
                 headers=headers,
                 timeout=15
             )
-            resp.encoding = 'euc-kr'        # 한글 깨짐 방지
             
             # 응답 유효성 검사
             if resp.status_code != 200:
                 print(f"   HTTP 오류: {resp.status_code}")
                 return None
                 
-            if len(resp.text) < 100:
-                print(f"   응답 데이터가 너무 짧음: {len(resp.text)}자")
+            # 크기 검사는 디코딩 없이 바이트 길이로 (본문은 파싱 시 lxml이 직접 디코딩)
+            body = resp.content
+            body_size = len(body)
+            if body_size < 100:
+                print(f"   응답 데이터가 너무 짧음: {body_size}바이트")
                 return None
                 
-            print(f"   [OK] API 호출 성공 (응답 크기: {len(resp.text)}자)")
-            return resp
+            print(f"   [OK] API 호출 성공 (응답 크기: {body_size}바이트)")
+            
+            # 유효한 응답(상태 200)의 본문만 캐시 (실패/빈 응답은 다음 검색에서 다시 요청)
+            self._api_cache[cache_key] = (time.monotonic(), body)
+            self._api_cache.move_to_end(cache_key)
+            while len(self._api_cache) > self._api_cache_size:
+                self._api_cache.popitem(last=False)
+            return body
             
         except Exception as e:
             print(f"   API 호출 예외: {e}")
             return None
 
-    def _extract_product_elements(self, response: requests.Response, strategy_name: str) -> List:
+    def _extract_product_elements(self, body: bytes, strategy_name: str) -> List:
         """
-        HTTP 응답에서 상품 HTML 요소들을 추출합니다.
+        API 응답 본문에서 상품 HTML 요소들을 추출합니다.
         다양한 CSS 선택자를 시도하여 상품 요소를 찾음
         
         Args:
-            response: HTTP 응답 객체
+            body: _call_search_api가 돌려준 응답 본문 바이트
             strategy_name: 전략 이름 (로깅용)
             
         Returns:
             List: BeautifulSoup 상품 요소 리스트
         """
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = self._make_soup(body)
         
         # 컴퓨존 사이트 구조 분석 결과를 바탕으로 다양한 선택자 시도
         # 우선순위 순으로 배치 (가장 확실한 것부터)
@@ -887,14 +1045,14 @@ class CompuzoneParser:
         print(f"   [ERROR] 모든 선택자에서 상품 요소를 찾지 못함")
         return []
 
-    def _parse_all_products(self, product_items: List, maker_codes: List[str], 
+    def _parse_all_products(self, product_items: List, maker_matcher: Optional[Pattern], 
                           keyword: str, limit: int) -> List[Product]:
         """
         추출된 상품 요소들을 개별적으로 파싱합니다.
         
         Args:
             product_items: BeautifulSoup 상품 요소 리스트
-            maker_codes: 제조사 필터 코드
+            maker_matcher: _prepare_maker_codes()로 만든 제조사 필터 (None이면 필터 없음)
             keyword: 검색 키워드
             limit: 최대 상품 수
             
@@ -910,7 +1068,7 @@ class CompuzoneParser:
         for index, item in enumerate(product_items, 1):
             try:
                 # 개별 상품 파싱 (옵션 상품 포함)
-                parsed_products = self._parse_product_item_with_options(item, maker_codes, keyword)
+                parsed_products = self._parse_product_item_with_options(item, maker_matcher, keyword)
                 
                 if parsed_products:
                     all_products.extend(parsed_products)
@@ -987,11 +1145,11 @@ class CompuzoneParser:
         
         return final_products
 
-    def _parse_product_item_with_options(self, item, maker_codes: List[str], keyword: str) -> List[Product]:
+    def _parse_product_item_with_options(self, item, maker_matcher: Optional[Pattern], keyword: str) -> List[Product]:
         """제품 아이템을 파싱하고 검색어에 맞는 옵션만 필터링합니다."""
         try:
             # 제품명 추출
-            product_name_tag = item.select_one(".prd_info_name.prdTxt, .prd_info_name")
+            product_name_tag = _ITEM_NAME_SEL.select_one(item)
             if not product_name_tag:
                 return []
                 
@@ -1000,8 +1158,8 @@ class CompuzoneParser:
                 return []
             
             # 브랜드 필터링 (개선된 동적 매칭 방식)
-            if maker_codes:
-                brand_found = self._check_brand_match(base_product_name, maker_codes)
+            if maker_matcher is not None:
+                brand_found = self._check_brand_match(base_product_name, maker_matcher)
                 if not brand_found:
                     return []
             
@@ -1009,7 +1167,7 @@ class CompuzoneParser:
             capacity_filter = self._extract_capacity_from_keyword(keyword)
             
             # 옵션 섹션 확인
-            option_wrap = item.select_one(".prd_option_wrap")
+            option_wrap = _OPTION_WRAP_SEL.select_one(item)
             if option_wrap:
                 return self._parse_product_options_filtered(item, base_product_name, capacity_filter)
             else:
@@ -1026,14 +1184,8 @@ class CompuzoneParser:
         keyword_upper = keyword.upper()
         
         # 용량 패턴 매칭 (숫자 + 단위)
-        capacity_patterns = [
-            r'(\d+)\s*TB',
-            r'(\d+)\s*GB',
-            r'(\d+)\s*MB'
-        ]
-        
-        for pattern in capacity_patterns:
-            match = re.search(pattern, keyword_upper)
+        for pattern in _CAPACITY_PATTERNS:
+            match = pattern.search(keyword_upper)
             if match:
                 number = match.group(1)
                 if 'TB' in keyword_upper:
@@ -1050,12 +1202,16 @@ class CompuzoneParser:
         products = []
         
         try:
-            option_items = item.select(".prd_option")
+            option_items = _OPTION_SEL.select(item)
+            
+            # 제품 링크/기본 사양은 옵션마다 같으므로 제품 단위로 한 번만 추출
+            product_link = self._extract_product_link(item)
+            base_specs = self._extract_base_product_specs(item)
             
             for option_item in option_items:
                 # 옵션명 추출 (두 가지 구조 모두 지원)
-                option_name_tag = option_item.select_one(".op_name")  # HDD 타입
-                opt_detail_tag = option_item.select_one(".opt_name")  # SSD 타입
+                option_name_tag = _OP_NAME_SEL.select_one(option_item)  # HDD 타입
+                opt_detail_tag = _OPT_NAME_SEL.select_one(option_item)  # SSD 타입
                 
                 option_name = ""
                 option_detail = ""
@@ -1076,17 +1232,17 @@ class CompuzoneParser:
                         continue
                 
                 # 세부 옵션 영역 확인 (.op_list_area)
-                op_list_area = option_item.select_one(".op_list_area")
+                op_list_area = _OP_LIST_AREA_SEL.select_one(option_item)
                 if op_list_area:
                     # 세부 옵션들이 있는 경우 (예: 4TB 개별/5팩/10팩)
-                    sub_options = op_list_area.select(".op_list")
+                    sub_options = _OP_LIST_SEL.select(op_list_area)
                     for sub_opt in sub_options:
-                        sub_product = self._parse_sub_option(sub_opt, base_product_name, option_name, item)
+                        sub_product = self._parse_sub_option(sub_opt, base_product_name, option_name, base_specs)
                         if sub_product:
                             products.append(sub_product)
                 else:
                     # 세부 옵션이 없는 일반적인 경우
-                    product = self._parse_regular_option(option_item, base_product_name, option_name, item)
+                    product = self._parse_regular_option(option_item, base_product_name, option_name, product_link, base_specs)
                     if product:
                         products.append(product)
                 
@@ -1095,11 +1251,12 @@ class CompuzoneParser:
         
         return products
 
-    def _parse_sub_option(self, sub_opt, base_product_name: str, option_name: str, item) -> Optional[Product]:
+    def _parse_sub_option(self, sub_opt, base_product_name: str, option_name: str,
+                          base_specs: List[str]) -> Optional[Product]:
         """세부 옵션을 파싱합니다 (예: 4TB 개별/5팩/10팩)."""
         try:
             # 세부 옵션명 추출 (.opt_name)
-            sub_opt_name_tag = sub_opt.select_one(".opt_name")
+            sub_opt_name_tag = _OPT_NAME_SEL.select_one(sub_opt)
             if not sub_opt_name_tag:
                 return None
                 
@@ -1107,14 +1264,14 @@ class CompuzoneParser:
             
             # 제품 번호 추출 (세부 옵션에서)
             product_link = ""
-            checkbox = sub_opt.select_one(".SelGroupProductNo")
+            checkbox = _GROUP_PRODUCT_NO_SEL.select_one(sub_opt)
             if checkbox:
                 product_no = checkbox.get('value')
                 if product_no:
                     product_link = f"https://www.compuzone.co.kr/product/product_detail.htm?ProductNo={product_no}"
             
             # 세부 옵션 가격 추출
-            sub_price_tag = sub_opt.select_one(".op_price .f_black")
+            sub_price_tag = _SUB_PRICE_SEL.select_one(sub_opt)
             if not sub_price_tag:
                 # 품절인지 확인
                 if "품절" in sub_opt.get_text() or "재입고" in sub_opt.get_text():
@@ -1134,7 +1291,7 @@ class CompuzoneParser:
             option_specs.append(option_name)
             
             # 2. 세부 사양 추가 (괄호 안의 내용)
-            spec_match = re.search(r'\(([^)]+)\)', sub_opt_name)
+            spec_match = _PAREN_RE.search(sub_opt_name)
             if spec_match:
                 detailed_specs = spec_match.group(1)
                 option_specs.append(detailed_specs)
@@ -1146,7 +1303,6 @@ class CompuzoneParser:
                 option_specs.append("10개 팩")
             
             # 4. 기본 제품 사양 추가
-            base_specs = self._extract_base_product_specs(item)
             if base_specs:
                 option_specs.extend(base_specs[:1])  # 최대 1개만
             
@@ -1174,26 +1330,12 @@ class CompuzoneParser:
             print(f"세부 옵션 파싱 중 오류: {e}")
             return None
 
-    def _parse_regular_option(self, option_item, base_product_name: str, option_name: str, item) -> Optional[Product]:
-        """일반적인 옵션을 파싱합니다."""
+    def _parse_regular_option(self, option_item, base_product_name: str, option_name: str,
+                              product_link: str, base_specs: List[str]) -> Optional[Product]:
+        """일반적인 옵션을 파싱합니다 (링크/기본 사양은 제품 단위로 한 번 구한 값 사용)."""
         try:
-            # 제품 번호 추출 (메인 제품에서)
-            product_link = ""
-            main_link = item.select_one(".prd_info_name")
-            if main_link:
-                href = main_link.get('href')
-                if href:
-                    if href.startswith('http'):
-                        product_link = href
-                    elif href.startswith('/'):
-                        product_link = f"https://www.compuzone.co.kr{href}"
-                    elif href.startswith('../'):
-                        product_link = f"https://www.compuzone.co.kr/{href.replace('../', '')}"
-                    else:
-                        product_link = f"https://www.compuzone.co.kr/{href}"
-            
             # 옵션 가격 추출
-            option_price_tag = option_item.select_one(".op_price .f_black, .op_price span")
+            option_price_tag = _OPTION_PRICE_SEL.select_one(option_item)
             if not option_price_tag:
                 return None
                 
@@ -1225,16 +1367,15 @@ class CompuzoneParser:
                 option_specs.append(option_name)
             
             # 2. 세부 사양 추출 (SSD/HDD 타입별)
-            opt_detail_tag = option_item.select_one(".opt_name")
+            opt_detail_tag = _OPT_NAME_SEL.select_one(option_item)
             if opt_detail_tag:
                 additional_detail = opt_detail_tag.get_text(strip=True)
-                spec_match = re.search(r'\(([^)]+)\)', additional_detail)
+                spec_match = _PAREN_RE.search(additional_detail)
                 if spec_match:
                     detailed_specs = spec_match.group(1)
                     option_specs.append(detailed_specs)
             
             # 3. 기본 제품 사양 추가
-            base_specs = self._extract_base_product_specs(item)
             if base_specs:
                 option_specs.extend(base_specs[:2])  # 최대 2개만
             
@@ -1268,8 +1409,8 @@ class CompuzoneParser:
             return True
         
         # 숫자와 단위를 분리해서 정확히 매칭
-        filter_match = re.search(r'(\d+)\s*(TB|GB|MB)', filter_upper)
-        option_match = re.search(r'(\d+)\s*(TB|GB|MB)', option_upper)
+        filter_match = _SIZE_UNIT_RE.search(filter_upper)
+        option_match = _SIZE_UNIT_RE.search(option_upper)
         
         if filter_match and option_match:
             filter_num = filter_match.group(1)
@@ -1306,32 +1447,12 @@ class CompuzoneParser:
                     return None
             
             # 제품 링크 추출
-            product_link = ""
-            main_link = item.select_one(".prd_info_name")
-            if main_link:
-                href = main_link.get('href')
-                if href:
-                    if href.startswith('http'):
-                        product_link = href
-                    elif href.startswith('/'):
-                        product_link = f"https://www.compuzone.co.kr{href}"
-                    elif href.startswith('../'):
-                        product_link = f"https://www.compuzone.co.kr/{href.replace('../', '')}"
-                    else:
-                        product_link = f"https://www.compuzone.co.kr/{href}"
+            product_link = self._extract_product_link(item)
             
             # 기존 단일 제품 파싱 로직
             price_text = "품절"
-            price_selectors = [
-                ".prd_price .number",
-                ".prd_price .price", 
-                ".price_sect .number",
-                ".price .number",
-                ".prd_price"
-            ]
-            
-            for selector in price_selectors:
-                price_tag = item.select_one(selector)
+            for selector in _PRICE_SELECTORS:
+                price_tag = selector.select_one(item)
                 if price_tag:
                     price_text = price_tag.get_text(strip=True)
                     break
@@ -1341,8 +1462,7 @@ class CompuzoneParser:
                 formatted_price = "품절"
             
             specifications = self._extract_base_product_specs(item)
-            final_specs_text = " / ".join(specifications) if specifications else "컴퓨존 상품"
-            deduplicated_specs = self._smart_deduplicate_specs(final_specs_text)
+            deduplicated_specs = self._smart_deduplicate_specs(specifications) if specifications else "컴퓨존 상품"
             
             return Product(
                 name=product_name, 
@@ -1356,123 +1476,40 @@ class CompuzoneParser:
             print(f"단일 제품 파싱 중 오류: {e}")
             return None
 
-    def _parse_product_item(self, item, maker_codes: List[str]) -> Optional[Product]:
-        """제품 아이템을 파싱합니다."""
-        try:
-            # 제품명 추출
-            product_name_tag = item.select_one(".prd_info_name.prdTxt, .prd_info_name")
-            if not product_name_tag:
-                return None
-                
-            product_name = product_name_tag.get_text(strip=True)
-            if not product_name:
-                return None
-            
-            # 브랜드 필터링 (컴퓨존 [브랜드] 형식 고려)
-            if maker_codes:
-                brand_found = False
-                
-                # [브랜드] 형식에서 브랜드 추출
-                bracket_brand_match = re.search(r'\[([^\]]+)\]', product_name)
-                if bracket_brand_match:
-                    bracket_brand = bracket_brand_match.group(1).strip()
-                    
-                    # 브랜드 매칭 검사 (개선된 동적 방식)
-                    brand_found = self._check_brand_match(product_name, maker_codes)
-                    if not brand_found:
-                        return None
-            
-            # 가격 추출 - 여러 가능한 선택자 시도
-            price_text = "품절"  # 기본값을 품절로 변경
-            price_selectors = [
-                ".prd_price .number",
-                ".prd_price .price", 
-                ".price_sect .number",
-                ".price .number",
-                ".prd_price"
-            ]
-            
-            for selector in price_selectors:
-                price_tag = item.select_one(selector)
-                if price_tag:
-                    price_text = price_tag.get_text(strip=True)
-                    break
-            
-            # 가격 정리
-            formatted_price = self._format_price(price_text)
-            if formatted_price in ["가격 정보 없음", "가격 문의"]:
-                # 숫자 가격이 없으면 구매 불가능한 상태로 간주
-                formatted_price = "품절"
-            
-            # 사양 정보 추출 시도 (다양한 방법으로)
-            specifications = []
-            
-            # 1. 제품명에서 주요 사양 추출
-            name_specs = self._extract_specs_from_name(product_name)
-            if name_specs:
-                specifications.extend(name_specs)
-            
-            # 2. .prd_subTxt에서 상세 사양 정보 추출 (가장 정확한 방법)
-            prd_subTxt = item.select_one(".prd_subTxt")
-            if prd_subTxt:
-                spec_text = prd_subTxt.get_text(strip=True)
-                if spec_text and len(spec_text) > 10:
-                    # 불필요한 텍스트 제거 후 사양 정보 추가
-                    clean_spec = re.sub(r'\s+', ' ', spec_text)
-                    specifications.append(clean_spec[:200])  # 너무 길면 자르기
-            
-            # 3. .prd_subTxt가 없으면 .prd_info에서 추출 (기존 방법)
-            if not any('/' in spec for spec in specifications):
-                prd_info = item.select_one(".prd_info")
-                if prd_info:
-                    info_text = prd_info.get_text(separator=' | ', strip=True)
-                    parts = info_text.split(' | ')
-                    
-                    if len(parts) > 3:
-                        spec_part = parts[3].strip()
-                        if spec_part and len(spec_part) > 10 and not any(skip in spec_part for skip in ['토스', '확정발주', '입고지연']):
-                            spec_items = [s.strip() for s in spec_part.split('/') if s.strip() and len(s.strip()) > 2]
-                            if spec_items:
-                                selected_specs = spec_items[:5]
-                                specifications.append(' / '.join(selected_specs))
-            
-            # 4. 기본값 설정
-            if not specifications:
-                specifications.append("컴퓨존 상품")
-            
-            # 5. 최종 사양 스마트 중복 제거
-            final_specs_text = " / ".join(specifications)
-            deduplicated_specs = self._smart_deduplicate_specs(final_specs_text)
-            
-            return Product(
-                name=product_name, 
-                price=formatted_price, 
-                specifications=deduplicated_specs,
-                product_link="",
-                site="컴퓨존"
-            )
-            
-        except Exception as e:
-            print(f"제품 파싱 중 오류: {e}")
-            return None
+    def _extract_product_link(self, item) -> str:
+        """제품명 링크의 href를 절대 URL로 변환합니다 (없으면 빈 문자열)."""
+        main_link = _ITEM_LINK_SEL.select_one(item)
+        if not main_link:
+            return ""
+        
+        href = main_link.get('href')
+        if not href:
+            return ""
+        if href.startswith('http'):
+            return href
+        if href.startswith('/'):
+            return f"https://www.compuzone.co.kr{href}"
+        if href.startswith('../'):
+            return f"https://www.compuzone.co.kr/{href.replace('../', '')}"
+        return f"https://www.compuzone.co.kr/{href}"
 
     def _extract_base_product_specs(self, item) -> List[str]:
         """제품의 기본 사양 정보를 추출합니다."""
         specifications = []
         
         # 1. .prd_subTxt에서 상세 사양 정보 추출 (가장 정확한 방법)
-        prd_subTxt = item.select_one(".prd_subTxt")
+        prd_subTxt = _SUB_TXT_SEL.select_one(item)
         if prd_subTxt:
             spec_text = prd_subTxt.get_text(strip=True)
             if spec_text and len(spec_text) > 10:
                 # 불필요한 텍스트 제거 후 사양 정보 추가
-                clean_spec = re.sub(r'\s+', ' ', spec_text)
+                clean_spec = _WS_RE.sub(' ', spec_text)
                 spec_parts = [part.strip() for part in clean_spec.split('/') if part.strip()]
                 specifications.extend(spec_parts[:3])  # 처음 3개만
         
         # 2. .prd_subTxt가 없으면 .prd_info에서 추출 (기존 방법)
         if not specifications:
-            prd_info = item.select_one(".prd_info")
+            prd_info = _PRD_INFO_SEL.select_one(item)
             if prd_info:
                 info_text = prd_info.get_text(separator=' | ', strip=True)
                 parts = info_text.split(' | ')
@@ -1492,101 +1529,103 @@ class CompuzoneParser:
         name_upper = product_name.upper()
         
         # 1. 용량 정보 추출 (GB, TB)
-        capacity_matches = re.findall(r'(\d+[KMGT]?B)', name_upper)
+        capacity_matches = _NAME_CAPACITY_RE.findall(name_upper)
         for capacity in capacity_matches:
             # GPU인 경우 VRAM으로 표시
-            if any(keyword in name_upper for keyword in ['RTX', 'GTX', 'RX', 'RADEON', 'GEFORCE']):
+            if _GPU_MARKER_RE.search(name_upper):
                 specs.append(f"VRAM {capacity}")
                 break  # GPU는 하나의 VRAM만
             else:
                 specs.append(capacity)
                 break  # 저장장치도 하나의 용량만
         
-        # 2. 제품 시리즈 추출 (RTX, GTX, RX 등)
-        series_patterns = [
-            r'(RTX \d+)', r'(GTX \d+)', r'(RX \d+)', r'(ARC A\d+)',
-            r'(I\d-\d+K?F?)', r'(RYZEN \d+ \d+X?)'
-        ]
-        for pattern in series_patterns:
-            match = re.search(pattern, name_upper)
-            if match:
-                specs.append(match.group(1))
-                break  # 하나의 시리즈만
+        # 2. 제품 시리즈 추출 (RTX, GTX, RX 등) - 하나의 시리즈만
+        series = self._first_by_priority(_SERIES_RE, name_upper)
+        if series:
+            specs.append(series)
         
-        # 3. 메모리 타입 추출
-        memory_types = ['DDR5', 'DDR4', 'GDDR6X', 'GDDR6', 'HBM3', 'HBM2']
-        for mem_type in memory_types:
-            if mem_type in name_upper:
-                specs.append(mem_type)
-                break  # 하나의 메모리 타입만
+        # 3. 메모리 타입 추출 - 하나의 메모리 타입만
+        mem_type = self._first_by_priority(_MEMORY_TYPE_RE, name_upper)
+        if mem_type:
+            specs.append(mem_type)
         
         return specs[:3]  # 최대 3개만 반환
 
-    def _smart_deduplicate_specs(self, specs_text: str) -> str:
-        """스마트 사양 중복 제거 - 의미적 유사성 기반"""
-        if not specs_text:
-            return specs_text
-        
-        parts = [part.strip() for part in specs_text.split(" / ") if part.strip()]
+    @staticmethod
+    def _first_by_priority(pattern: "re.Pattern", text: str) -> Optional[str]:
+        """그룹 번호가 가장 작은(우선순위가 높은) 매치의 문자열, 같은 그룹이면 앞쪽 매치"""
+        best = None
+        for match in pattern.finditer(text):
+            if best is None or match.lastindex < best.lastindex:
+                best = match
+                if best.lastindex == 1:
+                    break
+        return best.group(best.lastindex) if best else None
+
+    def _smart_deduplicate_specs(self, specs: List[str]) -> str:
+        """스마트 사양 중복 제거 - 의미적 유사성 기반 (사양 목록 → " / "로 연결한 문자열)"""
+        # " / "로 묶여 들어온 항목만 개별 사양으로 나눔 (목록을 문자열로 합쳤다 다시 나누지 않음)
+        parts = [part.strip() for spec in specs for part in spec.split(" / ") if part.strip()]
+        # 공백뿐인 항목은 사양 개수가 1개 이하여도 결과에 남기지 않음 (예: '1TB /   ' → '1TB')
         if len(parts) <= 1:
-            return specs_text
+            return parts[0] if parts else ""
         
         unique_parts = []
+        unique_keys = []
+        slots_by_key = {}   # 중복 판별 키 → 그 키를 가진 unique_parts 위치들
         
         for part in parts:
-            is_duplicate = False
-            
-            for i, existing_part in enumerate(unique_parts):
-                if self._is_semantic_duplicate(part, existing_part):
-                    # 더 정보가 많은 것을 선택
-                    if len(part) > len(existing_part):
-                        unique_parts[i] = part
-                    is_duplicate = True
-                    break
+            keys = self._spec_dedup_keys(part)
+            slots = [slot for key in keys for slot in slots_by_key.get(key, ())]
             
-            if not is_duplicate:
+            if not slots:
+                for key in keys:
+                    slots_by_key.setdefault(key, set()).add(len(unique_parts))
                 unique_parts.append(part)
+                unique_keys.append(keys)
+                continue
+            
+            # 앞쪽부터 비교했을 때 처음 중복으로 판정되는 위치 → 더 정보가 많은 것을 선택
+            i = min(slots)
+            if len(part) > len(unique_parts[i]):
+                for key in unique_keys[i]:
+                    slots_by_key[key].discard(i)
+                for key in keys:
+                    slots_by_key.setdefault(key, set()).add(i)
+                unique_parts[i] = part
+                unique_keys[i] = keys
         
         return " / ".join(unique_parts)
     
-    def _is_semantic_duplicate(self, text1: str, text2: str) -> bool:
-        """두 텍스트가 의미적으로 중복인지 판단"""
-        t1, t2 = text1.lower().strip(), text2.lower().strip()
-        
-        # 1. 완전 동일
-        if t1 == t2:
-            return True
-        
-        # 2. 숫자+단위 패턴으로 용량 비교
-        def extract_capacity(text):
-            match = re.search(r'(\d+)\s*([KMGT]?B?)', text.upper())
-            if match:
-                number, unit = match.groups()
-                if unit in ['G', 'K', 'M', 'T']:
-                    unit = unit + 'B'
-                return (number, unit)
-            return None
-        
-        cap1, cap2 = extract_capacity(t1), extract_capacity(t2)
-        
-        # 같은 용량의 메모리/VRAM 정보면 중복
-        if cap1 and cap2 and cap1 == cap2:
-            has_mem1 = any(kw in t1 for kw in ['vram', 'memory', '메모리', 'gb', 'tb'])
-            has_mem2 = any(kw in t2 for kw in ['vram', 'memory', '메모리', 'gb', 'tb'])
-            if has_mem1 and has_mem2:
-                return True
-        
-        # 3. 제품 시리즈 중복 (RTX 5080 등)
-        def extract_series(text):
-            match = re.search(r'(RTX|GTX|RX|ARC)\s*(\d+)', text.upper())
-            return match.groups() if match else None
-        
-        series1, series2 = extract_series(t1), extract_series(t2)
-        if series1 and series2 and series1 == series2:
-            return True
-        
-        return False
-
+    @staticmethod
+    def _spec_dedup_keys(text: str) -> Tuple[tuple, ...]:
+        """
+        사양 조각의 중복 판별 키 (완전 동일 / 용량+메모리 표기 / 제품 시리즈)
+        
+        두 조각은 다음 중 하나면 의미상 중복으로 본다:
+        1. 소문자/공백 정리 후 완전히 같음
+        2. 둘 다 메모리/VRAM 표기이고 용량(숫자+단위, G→GB 등 정규화)이 같음
+        3. 제품 시리즈(RTX 5080 등)가 같음
+        조건마다 키를 하나씩 만들면 "키를 하나라도 공유함"이 곧 중복이므로,
+        모든 기존 조각과 쌍으로 비교하지 않고 키 조회만으로 중복을 찾을 수 있음
+        """
+        lowered = text.lower().strip()
+        upper = lowered.upper()
+        keys = [('raw', lowered)]
+        
+        match = _CAPACITY_UNIT_RE.search(upper)
+        if match and _MEMORY_MARKER_RE.search(lowered):
+            number, unit = match.groups()
+            if unit in ('G', 'K', 'M', 'T'):
+                unit = unit + 'B'
+            keys.append(('cap', number, unit))
+        
+        match = _SERIES_SHORT_RE.search(upper)
+        if match:
+            keys.append(('series',) + match.groups())
+        
+        return tuple(keys)
+    
     def _is_generic_term(self, brand_name: str) -> bool:
         """일반적인 용어나 의미없는 브랜드명인지 유연하게 확인합니다."""
         if not brand_name or len(brand_name.strip()) <= 1:
@@ -1595,7 +1634,7 @@ class CompuzoneParser:
         brand_lower = brand_name.lower().strip()
         
         # 1. 숫자로만 구성된 경우
-        if re.match(r'^\d+$', brand_name):
+        if _ALL_DIGITS_RE.match(brand_name):
             return True
         
         # 2. 의미없는 기호나 문자
@@ -1603,25 +1642,13 @@ class CompuzoneParser:
             return True
         
         # 3. 일반적인 형용사나 상태 표현 패턴
-        generic_patterns = [
-            r'신.*품',     # 신상품, 신제품 등
-            r'.*가격',     # 최저가격, 할인가격 등  
-            r'.*배송',     # 무료배송, 빠른배송 등
-            r'.*발송',     # 당일발송, 즉시발송 등
-            r'.*특가',     # 할인특가 등
-            r'.*이벤트',   # 특별이벤트 등
-            r'.*세일',     # 연말세일 등
-            r'\d+.*월',    # 날짜 표현
-            r'오전|오후|시간|분|초',  # 시간 표현
-        ]
-        
-        for pattern in generic_patterns:
-            if re.search(pattern, brand_lower):
+        for pattern in _GENERIC_TERM_PATTERNS:
+            if pattern.search(brand_lower):
                 return True
         
         # 4. 브랜드가 아닌 일반 명사나 형용사일 가능성이 높은 경우
         # 한글로만 구성되고 특정 패턴을 가진 경우
-        if re.match(r'^[가-힣]+$', brand_name):
+        if _HANGUL_ONLY_RE.match(brand_name):
             # 너무 일반적인 단어들은 제외 (길이 기반)
             if len(brand_name) <= 2:  # 2글자 이하 한글은 대부분 일반 명사
                 return True
@@ -1633,15 +1660,6 @@ class CompuzoneParser:
 
     def get_unique_products(self, keyword: str, maker_codes: List[str]) -> List[Product]:
         """danawa와 호환되도록 하지만 컴퓨존은 단일 검색만 수행"""
-        products = self.search_products(keyword, "sale_order", maker_codes, limit=10)
-        
-        # 중복 제거
-        unique_products = []
-        seen_names = set()
-        for product in products:
-            if product.name not in seen_names:
-                unique_products.append(product)
-                seen_names.add(product.name)
-        
-        return unique_products
+        # search_products가 파싱 단계에서 제조사 필터링, 마무리 단계에서 상품명 중복 제거까지 하므로 그대로 반환
+        return self.search_products(keyword, "sale_order", maker_codes, limit=10)
 
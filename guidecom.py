@@ -27,17 +27,253 @@
 """
 
 import os
+import functools
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
-from urllib.parse import quote_plus
+import soupsieve as sv
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, CData, FeatureNotFound, NavigableString, SoupStrainer
+from collections import OrderedDict
+from itertools import islice
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Pattern, Tuple
+from urllib.parse import quote_plus, urlencode
 import re
+import threading
 import time
 import random
 import traceback
 from models import Product
 
 
+# ========== 키워드 → 카테고리(cid) 매칭 테이블 ==========
+# 튜플 순서가 곧 우선순위 (여러 카테고리 키워드가 함께 있으면 앞쪽이 선택됨)
+_CATEGORY_KEYWORDS = (
+    ("8855", ("ssd", "nvme", "m.2", "solid")),              # SSD
+    ("8803", ("rtx", "gtx", "그래픽", "gpu", "vga")),       # 그래픽카드
+    ("8802", ("ram", "메모리", "ddr")),                     # 메모리
+    ("8800", ("cpu", "프로세서", "intel", "amd", "라이젠")),  # CPU
+    ("8804", ("hdd", "하드", "wd", "seagate")),             # HDD
+)
+_DEFAULT_CATEGORIES = ("8855", "8803", "8802")             # 매칭 실패 시 주요 3개 카테고리
+
+# 모든 카테고리 키워드를 그룹명 c<cid>의 단일 정규식으로 결합
+# 전방탐색으로 감싸서 겹치는 위치의 키워드도 빠짐없이 찾는다
+_CATEGORY_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<c{cid}>{'|'.join(re.escape(word) for word in words)})"
+        for cid, words in _CATEGORY_KEYWORDS
+    ) + ")"
+)
+_CATEGORY_RANK = {f"c{cid}": rank for rank, (cid, _) in enumerate(_CATEGORY_KEYWORDS)}
+
+# 정렬 옵션(코드/한글명/컴퓨존식 이름) → list.php order 값 (읽기 전용)
+_ORDER_MAPPING = MappingProxyType({
+    "price_0": "price_0",
+    "낮은가격": "price_0",
+    "priceasc": "price_0",
+    "reco_goods": "reco_goods",
+    "인기상품": "reco_goods",
+    "opiniondesc": "reco_goods",
+    "event_goods": "event_goods",
+    "행사상품": "event_goods",
+    "savedesc": "event_goods",
+})
+
+_MAX_MANUFACTURERS = 12                                    # 제조사 후보 최대 개수
+
+# list.php 응답은 goods-row 외에는 쓰지 않으므로 해당 서브트리만 트리로 구성
+_GOODS_ROW_STRAINER = SoupStrainer("div", class_="goods-row")
+
+# ========== 브랜드명 정규화 테이블 ==========
+_BRAND_ALIASES = {
+    "wd": "western digital",
+    "웨스턴 디지털": "western digital",
+    "에이수스": "asus",
+    "기가바이트": "gigabyte",
+    "조텍": "zotac",
+    "엔비디아": "nvidia",
+    "삼성": "삼성전자",
+    "samsung": "삼성전자",
+    "g skill": "gskill",
+    "tp-link": "tp link",
+}
+# 구분자(. _ / -)를 공백으로 치환하는 변환 테이블 (연속 공백은 split/join으로 정리)
+_BRAND_SEPARATORS = str.maketrans("._/-", "    ")
+
+# 제조사 추출 시 건너뛸 단어들 (날짜/상태/프로모션 표기)
+_MANUFACTURER_SKIP_WORDS = (
+    "신제품", "신상품", "공식인증", "병행수입", "벌크", "정품", "스페셜", "한정판",
+    "8월", "7월", "6월", "9월", "10월", "11월", "12월", "1월", "2월", "3월", "4월", "5월",
+    "새상품", "리퍼", "중고", "전시", "개봉", "박스", "오픈박스", "리퍼비시",
+    "할인", "특가", "세일", "이벤트", "프로모션", "한정", "무료배송", "당일발송"
+)
+# 단어가 건너뛸 단어의 일부인 경우(word in skip_word): 모든 부분 문자열 집합으로 O(1) 판별
+_SKIP_WORD_PARTS = frozenset(
+    skip_word[start:end]
+    for skip_word in _MANUFACTURER_SKIP_WORDS
+    for start in range(len(skip_word))
+    for end in range(start + 1, len(skip_word) + 1)
+)
+# 단어가 건너뛸 단어를 포함하는 경우(skip_word in word): 단일 정규식 스캔
+_SKIP_WORD_RE = re.compile("|".join(re.escape(skip_word) for skip_word in _MANUFACTURER_SKIP_WORDS))
+_TWO_WORD_BRANDS = frozenset({"western digital", "tp link", "g skill", "team group"})
+
+# ========== 상품 행 CSS 선택자 (모듈 로드 시 한 번 컴파일, 행마다 문자열 해석 생략) ==========
+# 각 항목은 (선택자 문자열, 컴파일된 선택자) - 문자열은 디버그 로그용. 목록 순서가 곧 우선순위
+def _compile_selectors(*selectors: str) -> Tuple[Tuple[str, "sv.SoupSieve"], ...]:
+    return tuple((selector, sv.compile(selector)) for selector in selectors)
+
+
+_NAME_SELECTORS = _compile_selectors(
+    ".desc .goodsname1",
+    ".desc h4.title a",
+    "h4.title a",
+    ".desc .title a",
+    ".title a",
+    ".desc a",
+    "a",
+)
+_LINK_SELECTORS = _NAME_SELECTORS[1:]      # 이름 요소가 링크가 아닐 때 같은 행에서 링크 찾기
+_TITLE_SELECTORS = _NAME_SELECTORS[:3]     # 제조사 추출용 상품명 (범용 링크 대체 선택자 제외)
+_SPEC_SELECTORS = _compile_selectors(
+    ".desc .feature",
+    ".feature",
+    ".desc .spec",
+    ".spec",
+    ".desc .description",
+    ".description",
+    ".desc .summary",
+    ".summary",
+    ".desc .info",
+    ".info",
+    ".desc ul",
+    ".desc p",
+    ".goodsinfo",
+)
+_PRICE_SELECTORS = _compile_selectors(
+    ".prices .price-large span",
+    ".price-large span",
+    ".price-large",
+    ".prices .price span",
+    ".price span",
+    ".price",
+    ".cost",
+    "[class*='price']",
+)
+_SELLER_SELECTORS = _compile_selectors(
+    '.shop_name', '.seller_name', '.company_name', '.store_name',
+    '.vendor', '.supplier', '[class*="shop"]', '[class*="seller"]',
+    '[class*="company"]', '[class*="store"]', '.desc .company',
+    '.item_shop', '.mall_name',
+)
+_DESC_SEL = sv.compile(".desc")
+
+
+def _select_first(row, selectors: Tuple[Tuple[str, "sv.SoupSieve"], ...]):
+    # 우선순위 순서대로 시도해 처음 찾은 (비어 있지 않은) 요소, 없으면 None
+    for _, compiled in selectors:
+        element = compiled.select_one(row)
+        if element:
+            return element
+    return None
+
+
+# ========== 제조사 필터 용어 ==========
+# 대표 브랜드 → 별칭. 선택된 코드가 그룹의 어느 이름과 같으면 그룹 전체 이름으로 매칭
+_MAKER_ALIAS_GROUPS = (
+    ('삼성', ('samsung', '삼성전자', 'sec')),
+    ('lg', ('lg전자', 'lge')),
+    ('hp', ('hewlett', 'packard')),
+    ('asus', ('에이수스', 'asustek')),
+    ('msi', ('micro-star',)),
+    ('western digital', ('wd', 'western', 'digital')),
+    ('seagate', ('시게이트',)),
+    ('kingston', ('킹스톤',)),
+)
+# 검색어에 들어 있으면 유통업체(병행수입) 상품도 통과시키는 브랜드
+_KEYWORD_BRANDS = ('삼성', 'samsung', 'lg', 'intel', 'amd', 'nvidia', 'asus', 'msi')
+
+_NON_DIGIT_RE = re.compile(r"[^\d]")                       # 가격에서 숫자 외 문자 제거
+_WS_RE = re.compile(r"\s+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+_ALL_DIGITS_RE = re.compile(r"^\d+$")
+_HANGUL_ONLY_RE = re.compile(r"^[가-힣]+$")
+_GENERIC_MANUFACTURER_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'신.*품',     # 신상품, 신제품 등
+    r'.*가격',     # 최저가격, 할인가격 등
+    r'.*배송',     # 무료배송, 빠른배송 등
+    r'.*발송',     # 당일발송, 즉시발송 등
+    r'.*특가',     # 할인특가 등
+    r'.*이벤트',   # 특별이벤트 등
+    r'.*세일',     # 연말세일 등
+    r'\d+.*월',    # 날짜 표현
+    r'오전|오후|시간|분|초',  # 시간 표현
+))
+
+_BRACKET_TAG_RE = re.compile(r"\[[^\]]+\]")                # [특가], [삼성전자] 같은 대괄호 태그
+_NAME_KEY_STOPWORDS = frozenset({"신제품", "정품", "벌크", "병행수입"})
+
+
+# 같은 상품명/제조사 코드가 정렬별 검색마다 반복되므로 결과를 메모이즈
+# (순수 함수라 인스턴스와 무관하게 모듈 수준에서 캐시)
+@functools.lru_cache(maxsize=4096)
+def _normalize_brand_text(text: str) -> str:
+    t = " ".join((text or "").lower().translate(_BRAND_SEPARATORS).split())
+    return _BRAND_ALIASES.get(t, t)
+
+
+@functools.lru_cache(maxsize=1024)
+def _priority_categories(keyword_lower: str) -> Tuple[str, ...]:
+    # 키워드에 따라 관련성 높은 카테고리부터 시도 (정규식 한 번으로 판별)
+    # 같은 검색어가 정렬별 검색/제조사 조회마다 반복되므로 결과를 메모이즈
+    ranks = [_CATEGORY_RANK[m.lastgroup] for m in _CATEGORY_RE.finditer(keyword_lower)]
+    if ranks:
+        return (_CATEGORY_KEYWORDS[min(ranks)][0],)
+    # 빠른 대체: 주요 3개 카테고리만 시도
+    return _DEFAULT_CATEGORIES
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_manufacturer_name(product_name: str) -> Optional[str]:
+    # 대괄호 제거 후 단어 분리 (split()이 연속 공백도 정리)
+    words = _BRACKET_TAG_RE.sub(" ", product_name).split()
+    
+    # 앞쪽의 날짜/상태 표기를 건너뛴 첫 단어 (정확한 매치 또는 부분 매치)
+    i = next(
+        (idx for idx, word in enumerate(words)
+         if word not in _SKIP_WORD_PARTS and not _SKIP_WORD_RE.search(word)),
+        None,
+    )
+    if i is None:
+        return None
+        
+    manufacturer = words[i]
+    
+    # 2단어 브랜드 결합(Western Digital, TP LINK 등)
+    if i + 1 < len(words):
+        pair = f"{manufacturer} {words[i+1]}"
+        if _normalize_brand_text(pair) in _TWO_WORD_BRANDS:
+            manufacturer = pair
+            
+    return manufacturer
+
+
+@functools.lru_cache(maxsize=8192)
+def _name_key(name: str) -> frozenset:
+    """
+    중복 판별용 상품명 키: 대괄호 태그/판매 표기를 뺀 소문자 토큰 집합
+    
+    "[특가] 삼성전자 990 EVO 1TB"와 "삼성전자 990 EVO 1TB 정품"처럼 표기만 다른
+    같은 상품을 하나로 본다. 남는 토큰이 없으면 원래 이름 전체를 키로 사용.
+    같은 상품이 여러 정렬 결과에 반복해 나오므로 이름별로 메모이즈 (frozenset이라 공유해도 안전).
+    """
+    tokens = frozenset(_BRACKET_TAG_RE.sub(" ", name).lower().split()) - _NAME_KEY_STOPWORDS
+    return tokens or frozenset((name,))
+
+
 class GuidecomParser:
     """
     가이드컴 웹사이트 파서 클래스
@@ -89,6 +325,28 @@ class GuidecomParser:
         # ========== HTTP 세션 초기화 ==========
         self.session = requests.Session()          # 쿠키 및 연결 유지용 세션
         self.last_request_time = 0.0               # 마지막 요청 시간 (간격 제어용)
+        self._request_lock = threading.Lock()      # 정렬별 병렬 검색 시 요청 간격 예약 보호
+        
+        # ========== 조건부 요청(ETag) 캐시 ==========
+        # (검색어, 정렬, 페이지, 개수, 카테고리) → (ETag, Last-Modified, 파싱된 soup)
+        # 같은 조합을 다시 요청할 때 304 응답이면 다운로드와 파싱을 모두 건너뜀
+        self._etag_cache: "OrderedDict[Tuple[str, ...], Tuple[str, str, BeautifulSoup]]" = OrderedDict()
+        self._etag_cache_size = 128                # LRU 최대 항목 수
+        self._etag_lock = threading.Lock()         # 여러 스레드가 같은 LRU를 갱신하므로 보호
+        
+        # ========== 검색어별 적중 카테고리 ==========
+        # 기본 카테고리를 차례로 찔러봐야 하는 검색어에서, 상품이 나온 cid를 기억해 두고
+        # 같은 검색어의 다음 요청(다른 정렬, 제조사 조회 후 본 검색)은 그 cid부터 시도
+        self._category_hits: "OrderedDict[str, str]" = OrderedDict()
+        self._category_hits_size = 256
+        self._category_lock = threading.Lock()
+        
+        # ========== 검색어별 제조사 목록 ==========
+        # 검색어 → (저장 시각, 제조사 목록). 같은 검색어로 다시 조회하면 5분 동안은 요청/파싱 생략
+        self._options_cache: "OrderedDict[str, Tuple[float, List[Dict[str, str]]]]" = OrderedDict()
+        self._options_cache_ttl = 300.0
+        self._options_cache_size = 64
+        self._options_lock = threading.Lock()
         
         # ========== 브라우저 헤더 및 세션 설정 ==========
         self._setup_session()
@@ -127,7 +385,8 @@ class GuidecomParser:
             "User-Agent": random.choice(self.user_agents),
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
             "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-            "Accept-Encoding": "gzip, deflate, br",
+            # 설치된 디코더 기준(brotli 미설치 시 br 제외) - 해제 못 하는 br 응답을 받지 않도록
+            "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
             "Sec-Fetch-Dest": "document",
@@ -136,22 +395,44 @@ class GuidecomParser:
             "Sec-Fetch-User": "?1",
             "Cache-Control": "max-age=0",
         })
+        
+        # 연결 풀 확대(정렬별 병렬 검색) + 일시적 서버 오류 재시도
+        # allowed_methods: 검색 요청 대부분이 list.php POST(조회 전용이라 재전송해도 안전)이므로
+        #   urllib3 기본값(POST 제외) 대신 GET/POST 모두 재시도
+        # raise_on_status=False: 재시도 후에도 실패하면 마지막 응답을 그대로 돌려 기존 상태 코드 검사에 맡김
+        # read=False: 읽기 타임아웃까지 재시도하면 한 요청이 타임아웃의 몇 배로 늘어나므로 제외
+        #   (GET은 _make_request의 재시도 루프가 따로 처리)
+        retry = Retry(
+            total=3,
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
-    def _update_headers(self) -> None:
-        self.session.headers.update({
+    def _rotating_headers(self) -> Dict[str, str]:
+        # 요청마다 바꿔 보내는 헤더 (요청별 dict로 넘김 - 정렬별 병렬 검색 스레드가
+        # 공유하는 session.headers는 설정 후 건드리지 않음)
+        return {
             "User-Agent": random.choice(self.user_agents),
             "Cache-Control": random.choice(["no-cache", "max-age=0"]),
-        })
+        }
 
     def _get_random_delay(self, a: float = 0.35, b: float = 0.9) -> float:
         return random.uniform(a, b)
 
     def _wait_between_requests(self, min_gap: float = 0.1) -> None:
-        now = time.time()
-        delta = now - self.last_request_time
-        if delta < min_gap:
-            time.sleep(min_gap - delta)
-        self.last_request_time = time.time()
+        # 다음 요청 시각을 잠금 안에서 예약하고, 대기는 잠금 밖에서 수행
+        with self._request_lock:
+            now = time.time()
+            wait = max(0.0, self.last_request_time + min_gap - now)
+            self.last_request_time = now + wait
+        if wait > 0:
+            time.sleep(wait)
 
     def _fix_encoding(self, resp: requests.Response) -> None:
         try:
@@ -162,11 +443,25 @@ class GuidecomParser:
             self._dbg(f"Encoding fix failed: {e}")
             resp.encoding = 'euc-kr'
 
+    def _make_soup(self, resp: requests.Response, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """
+        응답 바이트를 그대로 lxml에 넘겨 파싱한다 (디코딩도 lxml이 C 레벨에서 처리).
+        
+        libxml2는 'euc-kr' 선언 시 CP949 확장 한글(예: '똠')을 만나면 문서 전체를
+        버리므로 상위 집합인 cp949로 넘긴다. lxml이 없으면 html.parser로 대체.
+        """
+        encoding = resp.encoding
+        if encoding and encoding.lower().replace("_", "-") == "euc-kr":
+            encoding = "cp949"
+        try:
+            return BeautifulSoup(resp.content, "lxml", from_encoding=encoding, parse_only=parse_only)
+        except FeatureNotFound:
+            return BeautifulSoup(resp.content, "html.parser", from_encoding=encoding, parse_only=parse_only)
+
     def _make_request(self, url: str, params: Optional[Dict[str, str]] = None, retries: int = 2) -> requests.Response:
         last_exc = None
         for attempt in range(retries):
             try:
-                self._update_headers()
                 self._wait_between_requests()
                 
                 # 재시도시 최소 대기
@@ -184,32 +479,37 @@ class GuidecomParser:
                 
                 self._dbg(f"GET {url} params={params} extra_headers={extra_headers}")
                 
+                request_headers = self._rotating_headers()
+                request_headers.update(extra_headers)
                 resp = self.session.get(
                     url, 
                     params=params, 
-                    headers=extra_headers,
+                    headers=request_headers,
                     timeout=45,  # 더 긴 타임아웃
                     allow_redirects=True,
                     verify=True  # SSL 검증 활성화
                 )
                 
                 self._fix_encoding(resp)
-                self._dbg(f"GET status={resp.status_code} encoding={resp.encoding} len={len(resp.text)}")
+                # 길이 검사는 디코딩 없이 바이트로 (resp.text는 접근할 때마다 본문 전체를 다시 디코딩함)
+                body_size = len(resp.content)
+                self._dbg(f"GET status={resp.status_code} encoding={resp.encoding} len={body_size}")
                 
                 # 응답 상태 체크
                 if resp.status_code == 200:
                     # 매우 관대한 조건으로 변경
-                    if len(resp.text) > 50:  # 최소 50자만 있으면 통과
+                    if body_size > 50:  # 최소 50바이트만 있으면 통과
                         return resp
                     else:
-                        self._dbg(f"Response too short: {len(resp.text)} chars")
+                        self._dbg(f"Response too short: {body_size} bytes")
                 elif resp.status_code in [301, 302, 303, 307, 308]:
                     self._dbg(f"Redirect detected: {resp.status_code}")
                     return resp  # 리다이렉트도 허용
                 else:
                     self._dbg(f"HTTP Error: {resp.status_code}")
                     self._dbg(f"Response Headers: {dict(resp.headers)}")
-                    self._dbg(f"Response Text (first 300 chars): {resp.text[:300]}")
+                    if self.debug:
+                        self._dbg(f"Response Text (first 300 chars): {resp.text[:300]}")
                     
             except requests.exceptions.Timeout:
                 self._dbg(f"TIMEOUT on attempt {attempt+1}/{retries}")
@@ -229,43 +529,37 @@ class GuidecomParser:
         try:
             # 먼저 메인 검색 페이지 방문으로 세션 설정
             search_page_url = f"https://www.guidecom.co.kr/search/index.html?keyword={quote_plus(keyword)}&order={order}"
+            rotating_headers = self._rotating_headers()
             try:
-                self.session.get(search_page_url, timeout=10)
+                self.session.get(search_page_url, headers=rotating_headers, timeout=10)
             except:
                 pass  # 세션 설정 실패해도 계속 진행
             
-            self._update_headers()
             self._wait_between_requests()
             
             # 정확한 Referer와 헤더 설정
             headers = {
+                **rotating_headers,
                 "Referer": search_page_url,
                 "X-Requested-With": "XMLHttpRequest",
                 "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
                 "Accept": "*/*"
             }
             data = {"keyword": keyword, "order": order, "lpp": lpp, "page": page, "y": 0}
+            # 요청 본문은 한 번만 인코딩해 두고 카테고리별로 cid만 덧붙임 (요청마다 dict 인코딩 생략)
+            base_body = urlencode(data)
             
             # 컴퓨터주요부품 카테고리 필터 적용
             if use_computer_parts_filter:
-                # 키워드에 따라 관련성 높은 카테고리부터 시도
-                keyword_lower = keyword.lower()
+                # 키워드에 따라 관련성 높은 카테고리부터 시도 (검색어별로 캐시된 목록의 복사본)
+                hit_key = keyword.lower()
+                priority_categories = list(_priority_categories(hit_key))
                 
-                # 빠른 카테고리 매칭 (주요 키워드만)
-                priority_categories = []
-                if any(k in keyword_lower for k in ["ssd", "nvme", "m.2", "solid"]):
-                    priority_categories = ["8855"]  # SSD
-                elif any(k in keyword_lower for k in ["rtx", "gtx", "그래픽", "gpu", "vga"]):
-                    priority_categories = ["8803"]  # 그래픽카드
-                elif any(k in keyword_lower for k in ["ram", "메모리", "ddr"]):
-                    priority_categories = ["8802"]  # 메모리
-                elif any(k in keyword_lower for k in ["cpu", "프로세서", "intel", "amd", "라이젠"]):
-                    priority_categories = ["8800"]  # CPU
-                elif any(k in keyword_lower for k in ["hdd", "하드", "wd", "seagate"]):
-                    priority_categories = ["8804"]  # HDD
-                else:
-                    # 빠른 대체: 주요 3개 카테고리만 시도
-                    priority_categories = ["8855", "8803", "8802"]
+                # 이전에 같은 검색어로 상품이 나온 카테고리를 맨 앞으로
+                hit_cid = self._category_hits.get(hit_key)
+                if hit_cid in priority_categories:
+                    priority_categories.remove(hit_cid)
+                    priority_categories.insert(0, hit_cid)
                 
                 self._dbg(f"Priority categories for '{keyword}': {priority_categories}")
                 
@@ -275,16 +569,15 @@ class GuidecomParser:
                         data_with_cid = data.copy()
                         data_with_cid["cid"] = cid
                         self._dbg(f"POST {self.list_url} with cid={cid}")
-                        resp = self.session.post(self.list_url, data=data_with_cid, headers=headers, timeout=15)
-                        self._fix_encoding(resp)
+                        soup = self._post_list_soup(data_with_cid, headers, f"{base_body}&cid={cid}")
                         
-                        if resp.status_code == 200 and len(resp.text) > 100:
-                            soup = BeautifulSoup(resp.text, "lxml")
+                        if soup is not None:
                             rows = soup.find_all("div", class_="goods-row")
                             self._dbg(f"Category {cid}: found {len(rows)} products")
                             
                             if len(rows) > 0:  # 결과가 있으면 바로 사용
                                 self._dbg(f"Using category {cid} with {len(rows)} products")
+                                self._remember_category_hit(hit_key, cid)
                                 return soup
                                 
                         # 카테고리별 요청 간격 단축
@@ -298,11 +591,8 @@ class GuidecomParser:
             
             # 컴퓨터 부품 필터가 결과를 못 찾거나 비활성화된 경우 기본 검색
             self._dbg(f"POST {self.list_url} data={data}")
-            resp = self.session.post(self.list_url, data=data, headers=headers, timeout=15)
-            self._fix_encoding(resp)
-            self._dbg(f"POST status={resp.status_code} encoding={resp.encoding} len={len(resp.text)}")
-            if resp.status_code == 200 and len(resp.text) > 100:
-                soup = BeautifulSoup(resp.text, "lxml")
+            soup = self._post_list_soup(data, headers, base_body)
+            if soup is not None:
                 rows = soup.find_all("div", class_="goods-row")
                 self._dbg(f"POST parsed goods-row={len(rows)}")
                 
@@ -317,6 +607,67 @@ class GuidecomParser:
             return None
         return None
     
+    def _remember_category_hit(self, key: str, cid: str) -> None:
+        with self._category_lock:
+            self._category_hits[key] = cid
+            self._category_hits.move_to_end(key)
+            while len(self._category_hits) > self._category_hits_size:
+                self._category_hits.popitem(last=False)
+    
+    def _post_list_soup(self, data: Dict[str, object], headers: Dict[str, str], body: str) -> Optional[BeautifulSoup]:
+        """
+        list.php에 조건부 POST를 보내고 파싱된 soup을 반환한다.
+        
+        data는 캐시 키용 요청 파라미터, body는 그 파라미터를 미리 urlencode한 요청 본문.
+        
+        같은 요청 조합으로 받은 응답에 ETag/Last-Modified가 있었다면
+        If-None-Match/If-Modified-Since 헤더를 붙여 보내고, 304 응답이면
+        캐시해 둔 soup을 그대로 재사용한다 (다운로드와 파싱 모두 생략).
+        
+        Returns:
+            BeautifulSoup: 200(본문 100자 초과) 또는 304 응답일 때, 그 외에는 None
+        """
+        cache_key = tuple(str(data.get(k, "")) for k in ("keyword", "order", "page", "lpp", "cid"))
+        with self._etag_lock:
+            cached = self._etag_cache.get(cache_key)
+        
+        request_headers = dict(headers)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                request_headers["If-None-Match"] = etag
+            if last_modified:
+                request_headers["If-Modified-Since"] = last_modified
+        
+        resp = self.session.post(self.list_url, data=body.encode("ascii"), headers=request_headers, timeout=15)
+        if resp.status_code == 304 and cached:
+            self._dbg(f"POST 304 Not Modified - reusing cached soup for {cache_key}")
+            with self._etag_lock:
+                if cache_key in self._etag_cache:
+                    self._etag_cache.move_to_end(cache_key)
+            return cached[2]
+        
+        self._fix_encoding(resp)
+        body_size = len(resp.content)  # 디코딩 없이 바이트 길이로 검사
+        self._dbg(f"POST status={resp.status_code} encoding={resp.encoding} len={body_size}")
+        if resp.status_code != 200 or body_size <= 100:
+            return None
+        
+        # goods-row만 파싱 (호출부는 모두 goods-row만 사용하며, 행이 없으면 GET 경로로 넘어감)
+        soup = self._make_soup(resp, parse_only=_GOODS_ROW_STRAINER)
+        
+        # 검증자가 있고 실제 상품이 있는 응답만 캐시 (빈 결과는 다음에 다시 요청)
+        etag = resp.headers.get("ETag", "")
+        last_modified = resp.headers.get("Last-Modified", "")
+        if (etag or last_modified) and soup.find("div", class_="goods-row") is not None:
+            with self._etag_lock:
+                self._etag_cache[cache_key] = (etag, last_modified, soup)
+                self._etag_cache.move_to_end(cache_key)
+                while len(self._etag_cache) > self._etag_cache_size:
+                    self._etag_cache.popitem(last=False)
+        
+        return soup
+    
     def _try_alternative_methods(self, keyword: str, order: str) -> Optional[BeautifulSoup]:
         """다양한 방법으로 상품 데이터 가져오기 시도 - POST 중심으로 최적화"""
         methods = [
@@ -348,7 +699,7 @@ class GuidecomParser:
         try:
             params = {"keyword": keyword, "order": order}
             resp = self._make_request(self.base_url, params=params)
-            soup = BeautifulSoup(resp.text, "lxml")
+            soup = self._make_soup(resp)
             # GET 방식은 템플릿만 반환하므로 실제 상품이 없음을 로그
             self._dbg("GET method returned template page (no actual products)")
             return soup
@@ -357,70 +708,26 @@ class GuidecomParser:
             return None
 
     # ----------------------- Parsing helpers -----------------------
-    def _find_goods_list(self, soup: BeautifulSoup):
-        # 1순위: 기본 goods-list
-        gl = soup.find(id="goods-list")
-        if gl and gl.find_all("div", class_="goods-row"):
-            self._dbg("Found products in #goods-list")
-            return gl
-            
-        # 2순위: placeholder 내부
-        placeholder = soup.find(id="goods-placeholder")
-        if placeholder:
-            inner = placeholder.find(id="goods-list")
-            if inner and inner.find_all("div", class_="goods-row"):
-                self._dbg("Found products in #goods-placeholder > #goods-list")
-                return inner
-        
-        # 3순위: 다양한 컨테이너 ID/클래스 시도
-        containers = [
-            soup.find(id="product-list"),
-            soup.find(id="search-results"),
-            soup.find(class_="product-list"),
-            soup.find(class_="search-results"),
-            soup.find(class_="goods-container"),
-            soup.find(class_="product-container")
-        ]
-        
-        for container in containers:
-            if container and container.find_all("div", class_="goods-row"):
-                self._dbg(f"Found products in alternative container: {container.get('id') or container.get('class')}")
-                return container
-        
-        # 4순위: 전체 soup에서 goods-row가 있는지 확인
-        if soup.find_all("div", class_="goods-row"):
-            self._dbg("Found goods-row in root soup")
-            return soup
-        
-        # 5순위: 다른 가능한 상품 컨테이너들 시도
-        alternative_selectors = [
-            "div[class*='product']",
-            "div[class*='item']", 
-            "div[class*='goods']",
-            ".product-item",
-            ".search-item",
-            ".list-item"
-        ]
-        
-        for selector in alternative_selectors:
-            items = soup.select(selector)
-            if items:
-                self._dbg(f"Found {len(items)} items with selector: {selector}")
-                # 가짜 goods-row 구조 생성
-                fake_container = soup.new_tag("div")
-                for item in items[:20]:  # 최대 20개
-                    item['class'] = item.get('class', []) + ['goods-row']
-                    fake_container.append(item)
-                return fake_container
-        
-        self._dbg("No product containers found anywhere")
-        return soup
-
     def _extract_text(self, el) -> str:
         return el.get_text(" ", strip=True) if el else ""
 
+    def _iter_strings_outside_links(self, el):
+        """<a> 하위 트리를 건너뛰며 텍스트 노드를 문서 순서대로 순회 (XPath `.//text()[not(ancestor::a)]`와 동일)"""
+        for child in el.children:
+            if isinstance(child, NavigableString):
+                if type(child) in (NavigableString, CData):  # 주석 등은 get_text와 동일하게 제외
+                    yield child
+            elif child.name != "a":
+                yield from self._iter_strings_outside_links(child)
+
+    def _extract_text_without_links(self, el) -> str:
+        """링크 텍스트를 제외한 나머지 텍스트 추출 (서브트리 복사 없이 한 번만 순회)"""
+        if not el:
+            return ""
+        return " ".join(t for t in (s.strip() for s in self._iter_strings_outside_links(el)) if t)
+
     def _parse_price(self, text: str) -> str:
-        digits = re.sub(r"[^\d]", "", text or "")
+        digits = _NON_DIGIT_RE.sub("", text or "")
         if not digits:
             return ""
         return f"{int(digits):,}원"
@@ -434,20 +741,10 @@ class GuidecomParser:
                 self._dbg(f"Row HTML (first 500 chars): {str(row)[:500]}")
             
             # 이름: 여러 선택자 시도
-            name_selectors = [
-                ".desc .goodsname1",
-                ".desc h4.title a", 
-                "h4.title a",
-                ".desc .title a",
-                ".title a",
-                ".desc a",
-                "a"
-            ]
-            
             name_el = None
             product_link = ""
-            for selector in name_selectors:
-                name_el = row.select_one(selector)
+            for selector, compiled in _NAME_SELECTORS:
+                name_el = compiled.select_one(row)
                 if name_el:
                     self._dbg(f"Found name with selector: {selector}")
                     # 링크 URL 추출 - name_el이 링크가 아닌 경우 부모 또는 형제 요소에서 링크 찾기
@@ -469,16 +766,8 @@ class GuidecomParser:
                             link_el = parent
                         else:
                             # 2. 같은 row 내에서 링크 찾기
-                            link_selectors = [
-                                ".desc h4.title a",
-                                "h4.title a", 
-                                ".desc .title a",
-                                ".title a",
-                                ".desc a",
-                                "a"
-                            ]
-                            for link_selector in link_selectors:
-                                link_el = row.select_one(link_selector)
+                            for _, link_compiled in _LINK_SELECTORS:
+                                link_el = link_compiled.select_one(row)
                                 if link_el and link_el.get('href'):
                                     break
                         
@@ -503,25 +792,9 @@ class GuidecomParser:
             self._dbg(f"Product name: {name}")
             
             # 스펙 추출: 더 광범위한 선택자
-            spec_selectors = [
-                ".desc .feature",
-                ".feature", 
-                ".desc .spec",
-                ".spec",
-                ".desc .description",
-                ".description",
-                ".desc .summary",
-                ".summary",
-                ".desc .info",
-                ".info",
-                ".desc ul",
-                ".desc p",
-                ".goodsinfo"
-            ]
-            
             specs = ""
-            for selector in spec_selectors:
-                spec_el = row.select_one(selector)
+            for selector, compiled in _SPEC_SELECTORS:
+                spec_el = compiled.select_one(row)
                 if spec_el:
                     specs = self._extract_text(spec_el)
                     if specs and specs != name:
@@ -530,39 +803,25 @@ class GuidecomParser:
                         
             if not specs:
                 # 마지막 시도: .desc 내 모든 텍스트 추출
-                desc_el = row.select_one(".desc")
+                desc_el = _DESC_SEL.select_one(row)
                 if desc_el:
                     # 링크 텍스트 제거하고 나머지 텍스트 가져오기
-                    desc_copy = desc_el.__copy__()
-                    for a_tag in desc_copy.find_all('a'):
-                        a_tag.decompose()
-                    specs = self._extract_text(desc_copy).strip()
+                    specs = self._extract_text_without_links(desc_el)
                     if specs:
                         self._dbg(f"Extracted specs from .desc (no links): {specs[:100]}")
                         
             if not specs:
                 self._dbg("=== SPECS NOT FOUND ===")
-                desc_el = row.select_one(".desc")
+                desc_el = _DESC_SEL.select_one(row)
                 if desc_el:
                     self._dbg(f"Desc HTML: {str(desc_el)[:300]}")
                 else:
                     self._dbg("No .desc element found")
                     
             # 가격 추출: 더 다양한 선택자
-            price_selectors = [
-                ".prices .price-large span",
-                ".price-large span",
-                ".price-large",
-                ".prices .price span",
-                ".price span", 
-                ".price",
-                ".cost",
-                "[class*='price']"
-            ]
-            
             price = ""
-            for selector in price_selectors:
-                price_el = row.select_one(selector)
+            for selector, compiled in _PRICE_SELECTORS:
+                price_el = compiled.select_one(row)
                 if price_el:
                     price = self._parse_price(self._extract_text(price_el))
                     if price:
@@ -582,149 +841,63 @@ class GuidecomParser:
 
     # ----------------------- Manufacturer helpers -----------------------
     def _normalize_brand(self, text: str) -> str:
-        t = (text or "").lower()
-        t = re.sub(r"[\s._/-]+", " ", t).strip()
-        aliases = {
-            "wd": "western digital",
-            "웨스턴 디지털": "western digital",
-            "에이수스": "asus",
-            "기가바이트": "gigabyte",
-            "조텍": "zotac",
-            "엔비디아": "nvidia",
-            "삼성": "삼성전자",
-            "samsung": "삼성전자",
-            "g skill": "gskill",
-            "tp-link": "tp link",
-        }
-        return aliases.get(t, t)
+        return _normalize_brand_text(text)
 
     def _extract_manufacturer(self, product_name: str) -> Optional[str]:
         if not product_name:
             return None
         
-        self._dbg(f"Extracting manufacturer from: '{product_name}'")
-        
-        # 대괄호 제거 및 정리
-        text = re.sub(r"\[[^\]]+\]", " ", product_name)
-        text = re.sub(r"\s+", " ", text).strip()
-        words = text.split()
-        
-        if not words:
-            self._dbg("No words found after cleaning")
-            return None
-            
-        self._dbg(f"Words after cleaning: {words}")
-        
-        # 건너뛸 단어들 - 더 포괄적으로 확장
-        skip = {
-            "신제품", "신상품", "공식인증", "병행수입", "벌크", "정품", "스페셜", "한정판",
-            "8월", "7월", "6월", "9월", "10월", "11월", "12월", "1월", "2월", "3월", "4월", "5월",
-            "새상품", "리퍼", "중고", "전시", "개봉", "박스", "오픈박스", "리퍼비시",
-            "할인", "특가", "세일", "이벤트", "프로모션", "한정", "무료배송", "당일발송"
-        }
-        
-        i = 0
-        while i < len(words):
-            word = words[i]
-            self._dbg(f"Checking word '{word}' (index {i})")
-            
-            # 정확한 매치 또는 부분 매치 확인
-            should_skip = False
-            for skip_word in skip:
-                if word == skip_word or skip_word in word or word in skip_word:
-                    should_skip = True
-                    self._dbg(f"Skipping word '{word}' (matched with '{skip_word}')")
-                    break
-                    
-            if not should_skip:
-                break
-            i += 1
-            
-        if i >= len(words):
-            self._dbg("All words were skipped, no manufacturer found")
-            return None
-            
-        manufacturer = words[i]
-        self._dbg(f"Found manufacturer candidate: '{manufacturer}'")
-        
-        # 2단어 브랜드 결합(Western Digital, TP LINK 등)
-        if i + 1 < len(words):
-            pair = f"{manufacturer} {words[i+1]}"
-            normalized_pair = self._normalize_brand(pair)
-            if normalized_pair in {"western digital", "tp link", "g skill", "team group"}:
-                manufacturer = pair
-                self._dbg(f"Combined into 2-word brand: '{manufacturer}'")
-                
-        self._dbg(f"Final manufacturer: '{manufacturer}'")
+        manufacturer = _extract_manufacturer_name(product_name)
+        self._dbg(f"Extracting manufacturer from: '{product_name}' -> '{manufacturer}'")
         return manufacturer
 
     def _extract_manufacturer_from_row(self, row) -> Optional[str]:
-        name_el = row.select_one(".desc .goodsname1")
-        if not name_el:
-            name_el = row.select_one(".desc h4.title a") or row.select_one("h4.title a")
+        name_el = _select_first(row, _TITLE_SELECTORS)
         name = self._extract_text(name_el)
         maker = self._extract_manufacturer(name)
         if self.debug:
             self._dbg(f"NAME='{name[:80]}' -> MFR='{maker}'")
         return maker
 
-    def _filter_by_maker(self, product: Product, maker_codes: List[str]) -> bool:
-        """제조사 필터링: 제품명에 선택된 제조사가 포함되면 통과"""
+    def _prepare_maker_codes(self, maker_codes: List[str], keyword: Optional[str] = None) -> Optional[Pattern]:
+        """
+        선택된 제조사 코드로 통과 조건이 되는 모든 용어를 모아 정규식 하나로 컴파일 (검색당 한 번)
+        
+        용어: 코드 자체, 정규화된 브랜드명, 해당 별칭 그룹의 모든 이름,
+        검색어에 포함된 브랜드(유통업체 상품 허용). 코드가 없으면 None (필터 없음).
+        """
         if not maker_codes:
-            return True
-            
-        product_name_lower = product.name.lower()
+            return None
         
-        # 핵심 로직: 제품명에 선택된 제조사 중 하나라도 포함되면 통과
+        terms = set()
         for code in maker_codes:
             code_lower = code.lower().replace("_", " ").strip()
-            
-            # 1. 직접 매칭: 제조사명이 제품명에 포함
-            if code_lower in product_name_lower:
-                return True
-            
-            # 2. 정규화된 브랜드명으로 매칭
-            normalized_code = self._normalize_brand(code_lower)
-            if normalized_code in product_name_lower:
-                return True
-            
-            # 3. 알려진 브랜드 별칭 매칭
-            brand_aliases = {
-                '삼성': ['samsung', '삼성전자', 'sec'],
-                'lg': ['lg전자', 'lge'],  
-                'hp': ['hewlett', 'packard'],
-                'asus': ['에이수스', 'asustek'],
-                'msi': ['micro-star'],
-                'western digital': ['wd', 'western', 'digital'],
-                'seagate': ['시게이트'],
-                'kingston': ['킹스톤']
-            }
-            
-            for brand, aliases in brand_aliases.items():
+            terms.add(code_lower)
+            terms.add(self._normalize_brand(code_lower))
+            for brand, aliases in _MAKER_ALIAS_GROUPS:
                 if brand == code_lower or code_lower in aliases:
-                    for alias in [brand] + aliases:
-                        if alias.lower() in product_name_lower:
-                            return True
-            
-            # 4. 가이드컴/컴퓨존 특화: 병행수입업체 처리
-            # 제조사명이 제품명에 없는 경우 = 유통업체일 가능성
-            # 이 경우 검색 키워드와 연관성이 있으면 포함
-            
-            # 현재 검색 중인 키워드에서 브랜드 추출
-            potential_brands = []
-            if hasattr(self, '_current_search_keyword'):
-                search_kw = self._current_search_keyword.lower()
-                # 검색어에서 브랜드 추출
-                for brand in ['삼성', 'samsung', 'lg', 'intel', 'amd', 'nvidia', 'asus', 'msi']:
-                    if brand in search_kw:
-                        potential_brands.append(brand)
-            
-            # 검색어의 브랜드가 제품명에 있으면 유통업체 제품으로 인정
-            for brand in potential_brands:
-                if brand in product_name_lower:
-                    return True
+                    terms.add(brand)
+                    terms.update(aliases)
         
-        return False
+        if keyword is None:
+            keyword = getattr(self, '_current_search_keyword', '')
+        search_kw = (keyword or "").lower()
+        terms.update(brand for brand in _KEYWORD_BRANDS if brand in search_kw)
+        
+        # 긴 용어를 앞에 두어 겹치는 별칭에서도 자연스럽게 매칭 (결과는 포함 여부만 사용)
+        return re.compile("|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)))
+
+    def _filter_by_maker(self, product: Product, maker_matcher: Optional[Pattern]) -> bool:
+        """제조사 필터링: 제품명에 선택된 제조사(또는 그 별칭)가 포함되면 통과
+        
+        Args:
+            product: 검사할 상품
+            maker_matcher: _prepare_maker_codes()로 미리 컴파일한 용어 정규식 (None이면 필터 없음)
+        """
+        if maker_matcher is None:
+            return True
+        # 모든 코드/별칭 용어를 한 번의 스캔으로 검사
+        return maker_matcher.search(product.name.lower()) is not None
     
     def _get_brand_aliases(self, brand: str) -> List[str]:
         """브랜드 별칭 목록 반환 (사용되지 않음 - 위 메서드에서 인라인 처리)"""
@@ -738,7 +911,7 @@ class GuidecomParser:
         mfr_lower = manufacturer.lower().strip()
         
         # 1. 숫자로만 구성된 경우
-        if re.match(r'^\d+$', manufacturer):
+        if _ALL_DIGITS_RE.match(manufacturer):
             return True
         
         # 2. 의미없는 기호나 문자
@@ -746,25 +919,13 @@ class GuidecomParser:
             return True
         
         # 3. 일반적인 형용사나 상태 표현 패턴
-        generic_patterns = [
-            r'신.*품',     # 신상품, 신제품 등
-            r'.*가격',     # 최저가격, 할인가격 등  
-            r'.*배송',     # 무료배송, 빠른배송 등
-            r'.*발송',     # 당일발송, 즉시발송 등
-            r'.*특가',     # 할인특가 등
-            r'.*이벤트',   # 특별이벤트 등
-            r'.*세일',     # 연말세일 등
-            r'\d+.*월',    # 날짜 표현
-            r'오전|오후|시간|분|초',  # 시간 표현
-        ]
-        
-        for pattern in generic_patterns:
-            if re.search(pattern, mfr_lower):
+        for pattern in _GENERIC_MANUFACTURER_PATTERNS:
+            if pattern.search(mfr_lower):
                 return True
         
         # 4. 명확히 일반적인 명사/형용사인 경우만 제외
         # 한글로만 구성된 경우 더 정교한 분석
-        if re.match(r'^[가-힣]+$', manufacturer):
+        if _HANGUL_ONLY_RE.match(manufacturer):
             # 1글자는 의미가 모호하므로 제외
             if len(manufacturer) <= 1:
                 return True
@@ -799,20 +960,13 @@ class GuidecomParser:
             return None
             
         # 다양한 선택자로 판매업체 정보 시도
-        seller_selectors = [
-            '.shop_name', '.seller_name', '.company_name', '.store_name',
-            '.vendor', '.supplier', '[class*="shop"]', '[class*="seller"]',
-            '[class*="company"]', '[class*="store"]', '.desc .company',
-            '.item_shop', '.mall_name'
-        ]
-        
-        for selector in seller_selectors:
-            elements = row_element.select(selector)
+        for _, compiled in _SELLER_SELECTORS:
+            elements = compiled.select(row_element)
             for element in elements:
                 text = element.get_text(strip=True)
                 if text and len(text.strip()) > 1:
                     # 간단한 정리
-                    text = re.sub(r'\s+', ' ', text).strip()
+                    text = _WS_RE.sub(' ', text).strip()
                     self._dbg(f"Found seller candidate: {text}")
                     return text
         
@@ -832,7 +986,27 @@ class GuidecomParser:
     def get_search_options(self, keyword: str) -> List[Dict[str, str]]:
         """
         제조사 후보를 반환 (실제 제품이 있는 제조사만)
+        
+        결과가 있으면 검색어별로 5분간 캐시하고, 호출자가 고쳐도 캐시가 바뀌지 않도록 복사본을 돌려준다.
         """
+        with self._options_lock:
+            cached = self._options_cache.get(keyword)
+            if cached and time.monotonic() - cached[0] < self._options_cache_ttl:
+                self._options_cache.move_to_end(keyword)
+                self._dbg(f"get_search_options: cache hit ({len(cached[1])} manufacturers)")
+                return [dict(option) for option in cached[1]]
+        
+        options = self._collect_search_options(keyword)
+        if options:
+            with self._options_lock:
+                self._options_cache[keyword] = (time.monotonic(), [dict(option) for option in options])
+                self._options_cache.move_to_end(keyword)
+                while len(self._options_cache) > self._options_cache_size:
+                    self._options_cache.popitem(last=False)
+        return options
+
+    def _collect_search_options(self, keyword: str) -> List[Dict[str, str]]:
+        """검색 결과 행에서 제조사/판매업체를 모아 정렬한 후보 목록 (get_search_options의 실제 조회)"""
         manufacturers: List[str] = []
         seen = set()
         try:
@@ -857,7 +1031,12 @@ class GuidecomParser:
 
             # 적당한 상품에서 제조사 및 판매업체 추출 (50개까지로 단축)
             for idx, row in enumerate(rows[:50]):
-                name_el = row.select_one(".desc .goodsname1") or row.select_one(".desc h4.title a") or row.select_one("h4.title a")
+                # 발견 순서대로 최대 개수만 사용하므로 다 모이면 나머지 행은 볼 필요 없음
+                if len(manufacturers) >= _MAX_MANUFACTURERS:
+                    self._dbg(f"Collected {len(manufacturers)} manufacturers after {idx} rows, stopping early")
+                    break
+                
+                name_el = _select_first(row, _TITLE_SELECTORS)
                 nm = self._extract_text(name_el)
                 if self.debug and idx < 10:
                     sample_names.append(nm)
@@ -894,27 +1073,15 @@ class GuidecomParser:
 
             def sort_key(x: str):
                 xn = self._normalize_brand(x)
-                return (0 if re.search(r"[가-힣]", x) else 1, xn)
+                return (0 if _HANGUL_RE.search(x) else 1, xn)
 
-            return [{"name": m, "code": self._normalize_brand(m).replace(" ", "_")} for m in sorted(filtered_manufacturers[:12], key=sort_key)]
+            return [{"name": m, "code": self._normalize_brand(m).replace(" ", "_")} for m in sorted(filtered_manufacturers[:_MAX_MANUFACTURERS], key=sort_key)]
         except Exception as e:
             self._dbg(f"get_search_options exception: {e}")
             return []
 
     def _resolve_order_param(self, sort_type: str) -> str:
-        mapping = {
-            "price_0": "price_0",
-            "낮은가격": "price_0",
-            "priceasc": "price_0",
-            "reco_goods": "reco_goods",
-            "인기상품": "reco_goods",
-            "opiniondesc": "reco_goods",
-            "event_goods": "event_goods",
-            "행사상품": "event_goods",
-            "savedesc": "event_goods",
-        }
-        k = (sort_type or "").lower()
-        return mapping.get(k, "reco_goods")
+        return _ORDER_MAPPING.get((sort_type or "").lower(), "reco_goods")
 
     def search_products(self, keyword: str, sort_type: str, maker_codes: List[str], limit: int = 5) -> List[Product]:
         """단일 정렬 기준으로 제품 최대 `limit`개 반환 (list.php 우선)."""
@@ -927,11 +1094,8 @@ class GuidecomParser:
             # 1) 다양한 방법으로 시도
             soup = self._try_alternative_methods(keyword, order)
             
-            if soup:
-                container = self._find_goods_list(soup)
-                rows = container.find_all("div", class_="goods-row") if container else []
-            else:
-                rows = []
+            # list.php 응답은 goods-row만 남기고 파싱했으므로(_GOODS_ROW_STRAINER) 행을 바로 수집
+            rows = soup.find_all("div", class_="goods-row") if soup else []
                 
             self._dbg(f"search_products: order={order} rows={len(rows)}")
             
@@ -939,13 +1103,16 @@ class GuidecomParser:
                 self._dbg("가이드컴에서 상품을 찾을 수 없습니다.")
                 return []
             
+            # 제조사 필터 용어 정규식은 상품마다가 아니라 검색당 한 번만 생성
+            maker_matcher = self._prepare_maker_codes(maker_codes, keyword)
+            
             out: List[Product] = []
             for idx, row in enumerate(rows):
                 p = self._parse_product_item(row)
                 if not p:
                     self._dbg(f"상품 {idx+1} 파싱 실패")
                     continue
-                if not self._filter_by_maker(p, maker_codes):
+                if not self._filter_by_maker(p, maker_matcher):
                     self._dbg(f"상품 '{p.name[:30]}...' 제조사 필터에서 제외됨")
                     continue
                 out.append(p)
@@ -980,8 +1147,8 @@ class GuidecomParser:
             List[Product]: 최대 10개의 중복 없는 상품 리스트
             
         동작 방식:
-        1. 각 카테고리별로 순차 검색 수행
-        2. 중복 상품명 제거 (seen_names로 관리)
+        1. 세 카테고리 검색을 스레드로 동시에 요청 (대기 시간 = 가장 느린 요청)
+        2. 카테고리 순서대로 중복 상품 제거 (상품명 토큰 집합 키 → 상품 dict로 관리)
         3. 카테고리별 목표 개수 달성 시 다음 카테고리로 이동
         4. 전체 결과를 10개로 제한하여 반환
         
@@ -1000,58 +1167,57 @@ class GuidecomParser:
                 ("event_goods", 3, "행사상품"),  # 할인순 정렬, 3개
             ]
             
-            all_results: List[Product] = []
-            seen_names = set()  # 중복 제거용 상품명 집합
-            total_attempted = 0
+            # 상품명 키 → 상품 (삽입 순서가 곧 결과 순서, 키 조회로 중복 검사)
+            selected: Dict[frozenset, Product] = {}
             
-            # ========== 카테고리별 순차 검색 ==========
-            for order_type, target_count, category_name in search_buckets:
+            # ========== 카테고리별 병렬 검색 ==========
+            # 정렬별 요청은 서로 독립이므로 동시에 보내고, 선별은 아래에서 카테고리 순서대로 수행
+            with ThreadPoolExecutor(max_workers=len(search_buckets)) as executor:
+                futures = [
+                    executor.submit(
+                        self.search_products,
+                        keyword=keyword,
+                        sort_type=order_type,
+                        maker_codes=maker_codes,
+                        limit=target_count * 10  # 넉넉하게 가져와서 선별
+                    )
+                    for order_type, target_count, _ in search_buckets
+                ]
+            
+            for (order_type, target_count, category_name), future in zip(search_buckets, futures):
                 try:
                     self._dbg(f"\n--- {category_name} 카테고리 검색 (목표: {target_count}개) ---")
                     
                     # 해당 카테고리에서 후보 상품들을 충분히 가져오기 (목표의 10배)
-                    candidates = self.search_products(
-                        keyword=keyword, 
-                        sort_type=order_type, 
-                        maker_codes=maker_codes, 
-                        limit=target_count * 10  # 넉넉하게 가져와서 선별
-                    )
-                    
-                    category_added = 0
+                    candidates = future.result()
                     
-                    # 후보 상품들 중에서 중복되지 않는 것들만 선별
+                    # 후보 내 중복은 첫 상품만 남기고, 앞 카테고리에서 이미 뽑힌 상품은 제외
+                    # (태그/판매 표기만 다른 같은 상품도 중복으로 보도록 _name_key 기준)
+                    bucket: Dict[frozenset, Product] = {}
                     for product in candidates:
-                        if not product or not product.name:
-                            continue
-                            
-                        # 중복 검사 (상품명 기준)
-                        if product.name in seen_names:
-                            continue
-                        
-                        # 새로운 상품 추가
-                        all_results.append(product)
-                        seen_names.add(product.name)
+                        if product and product.name:
+                            bucket.setdefault(_name_key(product.name), product)
+                    fresh = ((key, product) for key, product in bucket.items() if key not in selected)
+                    
+                    # 카테고리별 목표 개수만큼만 추가
+                    category_added = 0
+                    for key, product in islice(fresh, target_count):
+                        selected[key] = product
                         category_added += 1
-                        total_attempted += 1
-                        
                         self._dbg(f"  추가: {product.name[:40]}... - {product.price}")
-                        
-                        # 카테고리별 목표 달성 시 중단
-                        if category_added >= target_count:
-                            break
                     
-                    self._dbg(f"  {category_name} 완료: {category_added}개 추가 (총 {len(all_results)}개)")
+                    self._dbg(f"  {category_name} 완료: {category_added}개 추가 (총 {len(selected)}개)")
                     
                 except Exception as e:
                     self._dbg(f"  {category_name} 카테고리 검색 실패: {e}")
                     continue  # 이 카테고리는 실패해도 다음 카테고리 계속 진행
             
             # ========== 최종 결과 정리 ==========
+            all_results = list(selected.values())
             final_count = min(len(all_results), 10)  # 최대 10개로 제한
             final_results = all_results[:final_count]
             
             self._dbg(f"\n=== 가이드컴 통합 검색 완료 ===")
-            self._dbg(f"총 검색 시도: {total_attempted}개")
             self._dbg(f"중복 제거 후: {len(all_results)}개")
             self._dbg(f"최종 반환: {final_count}개")
             
@@ -16,9 +16,23 @@
 from dataclasses import dataclass
 from typing import Optional
 import re
+import sys
 
 
-@dataclass
+# Python 3.10+에서는 dataclass가 __slots__를 생성하도록 해서 인스턴스별 __dict__를 제거
+# (상품 객체당 메모리 절감 + 속성 접근 가속). 기본값이 있는 필드는 클래스 속성과
+# 충돌하므로 3.8/3.9에서는 __slots__를 직접 선언할 수 없어 기존 방식 그대로 동작
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# ========== 상품 생성 시마다 쓰이는 패턴/용어 (모듈 로드 시 한 번만 생성) ==========
+_NON_DIGITS_RE = re.compile(r'\D+')   # 숫자 외 문자 제거용 (한 번의 치환으로 숫자만 남김)
+
+_OUT_OF_STOCK_TERMS = frozenset({'품절', '재고없음', '일시품절'})
+_INQUIRY_TERMS = frozenset({'문의', '전화', '상담'})
+_UNAVAILABLE_TERMS = frozenset({'품절', '가격 문의', '가격 정보 없음', '재고없음'})
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Product:
     """
     상품 정보를 저장하는 표준 데이터 클래스
@@ -105,8 +119,8 @@ class Product:
             return ""
         
         # 앞뒤 공백 제거 및 연속 공백을 단일 공백으로 변환
-        cleaned = re.sub(r'\s+', ' ', str(value).strip())
-        return cleaned
+        # (str.split()은 \s와 같은 공백 문자 기준이라 정규식 없이 같은 결과)
+        return " ".join(str(value).split())
     
     def _standardize_price(self, price: str) -> str:
         """
@@ -124,26 +138,25 @@ class Product:
         price_lower = price.lower()
         
         # 특수 상태 처리
-        if any(word in price_lower for word in ['품절', '재고없음', '일시품절']):
+        if any(word in price_lower for word in _OUT_OF_STOCK_TERMS):
             return "품절"
         
-        if any(word in price_lower for word in ['문의', '전화', '상담']):
+        if any(word in price_lower for word in _INQUIRY_TERMS):
             return "가격 문의"
         
-        # 숫자가 포함된 가격 표준화
-        if re.search(r'\d', price):
+        # 숫자가 포함된 가격 표준화 (숫자 외 문자를 한 번에 제거)
+        digits = _NON_DIGITS_RE.sub('', price)
+        if digits:
             # 이미 "원"으로 끝나면 그대로 반환
             if price.endswith('원'):
                 return price
             
-            # 숫자만 추출해서 원화 형식으로 변환
-            numbers = re.findall(r'\d+', price)
-            if numbers:
-                try:
-                    price_num = int(''.join(numbers))
-                    return f"{price_num:,}원"
-                except ValueError:
-                    pass
+            # 숫자만 남긴 문자열을 원화 형식으로 변환
+            try:
+                price_num = int(digits)
+                return f"{price_num:,}원"
+            except ValueError:
+                pass
         
         return price
     
@@ -160,24 +173,20 @@ class Product:
         if not specs:
             return "사양 정보 없음"
         
-        # 슬래시로 구분된 사양들을 개별 정리
-        spec_parts = [part.strip() for part in specs.split('/') if part.strip()]
-        
-        # 빈 사양이면 기본값 반환
-        if not spec_parts:
-            return "사양 정보 없음"
-        
-        # 중복 제거 (순서 유지)
-        unique_specs = []
-        seen = set()
+        # 구분자가 없으면 사양이 하나뿐이므로 그대로 사용 (이미 _clean_string으로 정리됨)
+        if '/' not in specs:
+            return specs
         
-        for spec in spec_parts:
-            spec_clean = spec.lower().strip()
-            if spec_clean not in seen and len(spec_clean) > 0:
-                unique_specs.append(spec)
-                seen.add(spec_clean)
+        # 슬래시로 구분된 사양들을 개별 정리하면서 중복 제거
+        # (소문자 키 → 처음 나온 표기, dict가 삽입 순서를 유지하므로 별도 목록 불필요)
+        unique_specs = {}
+        for part in specs.split('/'):
+            spec = part.strip()
+            if spec:
+                unique_specs.setdefault(spec.lower(), spec)
         
-        return " / ".join(unique_specs) if unique_specs else "사양 정보 없음"
+        # 빈 사양이면 기본값 반환
+        return " / ".join(unique_specs.values()) if unique_specs else "사양 정보 없음"
     
     def get_display_price(self) -> str:
         """
@@ -210,8 +219,7 @@ class Product:
         Returns:
             bool: 구매 가능한 가격이면 True
         """
-        unavailable_terms = ['품절', '가격 문의', '가격 정보 없음', '재고없음']
-        return not any(term in self.price for term in unavailable_terms)
+        return not any(term in self.price for term in _UNAVAILABLE_TERMS)
     
     def get_numeric_price(self) -> Optional[int]:
         """
@@ -224,10 +232,10 @@ class Product:
             return None
         
         # 숫자만 추출
-        numbers = re.findall(r'\d+', self.price)
-        if numbers:
+        digits = _NON_DIGITS_RE.sub('', self.price)
+        if digits:
             try:
-                return int(''.join(numbers))
+                return int(digits)
             except ValueError:
                 pass
         
@@ -0,0 +1,8 @@
+"""
+테스트 공통 설정: 패키지 설치 없이 저장소 루트의 모듈(compuzone, guidecom, models)을 import
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,206 @@
+"""
+컴퓨존 파서 회귀 테스트
+
+제조사 필터(정규식 한 번 스캔)와 사양 중복 제거(키 조회)가 최적화 전 구현과
+같은 결과를 내는지 변경 전 로직을 옮긴 기준 구현과 비교하고, 검색 페이지 방문과
+API 호출 순서를 네트워크 대신 대체 함수로 확인합니다.
+"""
+
+import random
+import re
+from typing import List
+
+import pytest
+
+from compuzone import CompuzoneParser
+
+
+# ========== 변경 전 구현 (비교 기준) ==========
+_OLD_ALIAS_MAP = {
+    'amd': ['amd', '라이젠', 'ryzen'],
+    'intel': ['intel', '인텔', '코어', 'core'],
+    'samsung': ['삼성', 'samsung', '삼성전자'],
+    'nvidia': ['nvidia', '지포스', 'geforce', 'rtx', 'gtx'],
+    'asus': ['asus', '에이수스'],
+    'msi': ['msi'],
+    'gigabyte': ['gigabyte', '기가바이트'],
+    'western digital': ['wd', 'western digital', '웨스턴디지털'],
+    'seagate': ['seagate', '시게이트'],
+}
+
+
+def _old_check_brand_match(product_name: str, maker_codes: List[str]) -> bool:
+    if not maker_codes:
+        return True
+    product_name_lower = product_name.lower()
+    for code in maker_codes:
+        code_lower = code.lower().replace("_", " ").strip()
+        if code_lower in product_name_lower:
+            return True
+        for aliases in _OLD_ALIAS_MAP.values():
+            if code_lower in aliases:
+                for alias in aliases:
+                    if alias in product_name_lower:
+                        return True
+    return False
+
+
+def _old_is_semantic_duplicate(text1: str, text2: str) -> bool:
+    t1, t2 = text1.lower().strip(), text2.lower().strip()
+    if t1 == t2:
+        return True
+
+    def extract_capacity(text):
+        match = re.search(r'(\d+)\s*([KMGT]?B?)', text.upper())
+        if match:
+            number, unit = match.groups()
+            if unit in ['G', 'K', 'M', 'T']:
+                unit = unit + 'B'
+            return (number, unit)
+        return None
+
+    cap1, cap2 = extract_capacity(t1), extract_capacity(t2)
+    if cap1 and cap2 and cap1 == cap2:
+        has_mem1 = any(kw in t1 for kw in ['vram', 'memory', '메모리', 'gb', 'tb'])
+        has_mem2 = any(kw in t2 for kw in ['vram', 'memory', '메모리', 'gb', 'tb'])
+        if has_mem1 and has_mem2:
+            return True
+
+    def extract_series(text):
+        match = re.search(r'(RTX|GTX|RX|ARC)\s*(\d+)', text.upper())
+        return match.groups() if match else None
+
+    series1, series2 = extract_series(t1), extract_series(t2)
+    if series1 and series2 and series1 == series2:
+        return True
+    return False
+
+
+def _old_smart_deduplicate_specs(specs_text: str) -> str:
+    if not specs_text:
+        return specs_text
+    parts = [part.strip() for part in specs_text.split(" / ") if part.strip()]
+    if len(parts) <= 1:
+        return specs_text
+    unique_parts = []
+    for part in parts:
+        is_duplicate = False
+        for i, existing_part in enumerate(unique_parts):
+            if _old_is_semantic_duplicate(part, existing_part):
+                if len(part) > len(unique_parts[i]):
+                    unique_parts[i] = part
+                is_duplicate = True
+                break
+        if not is_duplicate:
+            unique_parts.append(part)
+    return " / ".join(unique_parts)
+
+
+# ========== 무작위 입력 생성 ==========
+_NAME_WORDS = [
+    "[삼성전자]", "삼성", "Samsung", "AMD", "라이젠", "Ryzen", "Intel", "인텔", "코어", "Core", "NVIDIA",
+    "지포스", "GeForce", "RTX", "GTX", "ASUS", "에이수스", "MSI", "GIGABYTE", "기가바이트", "WD",
+    "Western", "Digital", "웨스턴디지털", "Seagate", "시게이트", "7800X3D", "4070", "SUPER", "12GB", "1TB",
+]
+_CODES = [
+    "amd", "AMD", "ryzen", "intel", "core", "samsung", "삼성", "nvidia", "rtx", "geforce", "asus",
+    "msi", "gigabyte", "western_digital", "wd", "seagate", "시게이트", "unknownbrand", " MSI ", "",
+]
+_SPEC_PARTS = [
+    "VRAM 12GB", "12GB GDDR6X", "12GB", "메모리 16GB", "16GB", "16 gb", "1TB", "1 TB", "SSD 1TB",
+    "RTX 4070", "RTX 4070 SUPER", "RTX4070", "GTX 1660", "RX 7800", "ARC 770", "PCIe 4.0", "PCIe",
+    "DDR5-5600", "ddr5-5600", "NVMe", "M.2 2280", "8G", "8GB", "2280", "a", "A", "b",
+]
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return CompuzoneParser()
+
+
+def test_maker_filter_matches_previous_substring_logic(parser):
+    rng = random.Random(20250119)
+    for _ in range(3000):
+        codes = rng.sample(_CODES, rng.randint(0, 3))
+        matcher = parser._prepare_maker_codes(codes)
+        for _ in range(5):
+            name = " ".join(rng.choice(_NAME_WORDS) for _ in range(rng.randint(1, 5)))
+            expected = _old_check_brand_match(name, codes)
+            assert parser._check_brand_match(name, matcher) == expected, (codes, name)
+
+
+def test_maker_filter_without_codes_passes_everything(parser):
+    assert parser._prepare_maker_codes([]) is None
+    assert parser._check_brand_match("아무 상품", None)
+
+
+def test_spec_dedup_matches_previous_pairwise_logic(parser):
+    rng = random.Random(11)
+    for _ in range(5000):
+        parts = [rng.choice(_SPEC_PARTS) for _ in range(rng.randint(2, 7))]
+        # 이전 구현은 여러 사양을 " / "로 합친 문자열을 받았음
+        assert parser._smart_deduplicate_specs(parts) == _old_smart_deduplicate_specs(" / ".join(parts)), parts
+
+
+def test_spec_dedup_keeps_longer_variant_in_first_slot(parser):
+    specs = ["12GB", "RTX 4070", "VRAM 12GB", "RTX 4070 SUPER", "PCIe"]
+    assert parser._smart_deduplicate_specs(specs) == "VRAM 12GB / RTX 4070 SUPER / PCIe"
+
+
+@pytest.mark.parametrize("specs, expected", [
+    (["1TB", "   "], "1TB"),
+    (["1TB /   "], "1TB"),
+    (["   "], ""),
+    ([], ""),
+])
+def test_spec_dedup_drops_whitespace_only_parts(parser, specs, expected):
+    # 이전 구현은 공백이 아닌 항목이 1개 이하이면 입력 문자열을 그대로 돌려줘
+    # '1TB /   '처럼 공백뿐인 항목이 남았음 → 이제는 항상 제거
+    assert parser._smart_deduplicate_specs(specs) == expected
+
+
+# ========== 검색 페이지 방문(쿠키) → API 호출 순서 ==========
+def _stub_network(parser, calls, visit_ok=True):
+    def visit(search_url):
+        calls.append("visit")
+        if visit_ok:
+            parser._warmed_up = True
+        return visit_ok
+
+    def call_api(params, headers):
+        calls.append("api")
+        return None  # 모든 전략 실패로 처리 (순서만 확인)
+
+    parser._visit_search_page = visit
+    parser._call_search_api = call_api
+
+
+def test_cold_session_visits_search_page_before_first_api_call():
+    parser = CompuzoneParser()
+    calls = []
+    _stub_network(parser, calls)
+    parser.search_products("ssd", "sale_order", [], limit=5)
+    assert calls[0] == "visit"
+    assert calls.count("visit") == 1
+    assert calls[1:] and set(calls[1:]) == {"api"}
+
+
+def test_warm_session_skips_search_page_visit():
+    parser = CompuzoneParser()
+    calls = []
+    _stub_network(parser, calls)
+    parser.search_products("ssd", "sale_order", [], limit=5)
+    calls.clear()
+    parser.search_products("hdd", "sale_order", [], limit=5)
+    assert "visit" not in calls
+    assert calls and set(calls) == {"api"}
+
+
+def test_failed_visit_makes_no_api_call():
+    parser = CompuzoneParser()
+    calls = []
+    _stub_network(parser, calls, visit_ok=False)
+    assert parser.search_products("ssd", "sale_order", [], limit=5) == []
+    assert calls == ["visit"]
+    assert not parser._warmed_up
+
@@ -0,0 +1,166 @@
+"""
+가이드컴 파서 회귀 테스트
+
+제조사 필터(정규식 한 번 스캔)와 제조사명 추출(모듈 수준 메모이즈 함수)이
+최적화 전 구현과 같은 결과를 내는지, 변경 전 로직을 그대로 옮긴 기준 구현과
+무작위 상품명/제조사 코드 조합으로 비교합니다. 네트워크 요청은 하지 않습니다.
+"""
+
+import random
+import re
+from typing import List, Optional
+
+import pytest
+
+from guidecom import GuidecomParser, _extract_manufacturer_name
+from models import Product
+
+
+# ========== 변경 전 구현 (비교 기준) ==========
+def _old_normalize_brand(text: str) -> str:
+    t = (text or "").lower()
+    t = re.sub(r"[\s._/-]+", " ", t).strip()
+    aliases = {
+        "wd": "western digital",
+        "웨스턴 디지털": "western digital",
+        "에이수스": "asus",
+        "기가바이트": "gigabyte",
+        "조텍": "zotac",
+        "엔비디아": "nvidia",
+        "삼성": "삼성전자",
+        "samsung": "삼성전자",
+        "g skill": "gskill",
+        "tp-link": "tp link",
+    }
+    return aliases.get(t, t)
+
+
+def _old_extract_manufacturer(product_name: str) -> Optional[str]:
+    if not product_name:
+        return None
+    text = re.sub(r"\[[^\]]+\]", " ", product_name)
+    text = re.sub(r"\s+", " ", text).strip()
+    words = text.split()
+    if not words:
+        return None
+    skip = {
+        "신제품", "신상품", "공식인증", "병행수입", "벌크", "정품", "스페셜", "한정판",
+        "8월", "7월", "6월", "9월", "10월", "11월", "12월", "1월", "2월", "3월", "4월", "5월",
+        "새상품", "리퍼", "중고", "전시", "개봉", "박스", "오픈박스", "리퍼비시",
+        "할인", "특가", "세일", "이벤트", "프로모션", "한정", "무료배송", "당일발송"
+    }
+    i = 0
+    while i < len(words):
+        word = words[i]
+        should_skip = False
+        for skip_word in skip:
+            if word == skip_word or skip_word in word or word in skip_word:
+                should_skip = True
+                break
+        if not should_skip:
+            break
+        i += 1
+    if i >= len(words):
+        return None
+    manufacturer = words[i]
+    if i + 1 < len(words):
+        pair = f"{manufacturer} {words[i+1]}"
+        if _old_normalize_brand(pair) in {"western digital", "tp link", "g skill", "team group"}:
+            manufacturer = pair
+    return manufacturer
+
+
+def _old_filter_by_maker(product_name: str, maker_codes: List[str], keyword: str) -> bool:
+    if not maker_codes:
+        return True
+    product_name_lower = product_name.lower()
+    for code in maker_codes:
+        code_lower = code.lower().replace("_", " ").strip()
+        if code_lower in product_name_lower:
+            return True
+        if _old_normalize_brand(code_lower) in product_name_lower:
+            return True
+        brand_aliases = {
+            '삼성': ['samsung', '삼성전자', 'sec'],
+            'lg': ['lg전자', 'lge'],
+            'hp': ['hewlett', 'packard'],
+            'asus': ['에이수스', 'asustek'],
+            'msi': ['micro-star'],
+            'western digital': ['wd', 'western', 'digital'],
+            'seagate': ['시게이트'],
+            'kingston': ['킹스톤']
+        }
+        for brand, aliases in brand_aliases.items():
+            if brand == code_lower or code_lower in aliases:
+                for alias in [brand] + aliases:
+                    if alias.lower() in product_name_lower:
+                        return True
+        search_kw = keyword.lower()
+        for brand in ['삼성', 'samsung', 'lg', 'intel', 'amd', 'nvidia', 'asus', 'msi']:
+            if brand in search_kw and brand in product_name_lower:
+                return True
+    return False
+
+
+# ========== 무작위 입력 생성 ==========
+_NAME_WORDS = [
+    "삼성전자", "Samsung", "SEC", "WD", "Western", "Digital", "western_digital", "TP-LINK", "TP", "LINK",
+    "G.SKILL", "G", "SKILL", "Team", "Group", "ASUS", "에이수스", "ASUSTeK", "MSI", "Micro-Star",
+    "Kingston", "킹스톤", "Seagate", "시게이트", "LG전자", "LGE", "HP", "Hewlett", "Intel", "AMD",
+    "NVIDIA", "웨스턴", "디지털", "8월", "월", "신제품", "정품", "박스", "무료배송", "특가세일", "오픈박스",
+    "한정", "품", "990", "EVO", "1TB", "SN580", "DDR5-5600", "RTX", "4070", "[특가]", "[삼성전자]", "[WD]",
+]
+_CODES = [
+    "삼성", "samsung", "삼성전자", "sec", "wd", "western_digital", "Western Digital", "tp_link",
+    "g.skill", "asus", " ASUS ", "msi", "micro-star", "hp", "packard", "lg", "lge", "kingston",
+    "seagate", "시게이트", "intel", "amd", "nvidia", "unknownbrand", "",
+]
+_KEYWORDS = ["", "ssd", "삼성 ssd", "intel cpu", "rtx 4070 msi", "samsung 990", "lg 모니터", "nvidia amd"]
+
+
+def _random_name(rng: random.Random) -> str:
+    words = [rng.choice(_NAME_WORDS) for _ in range(rng.randint(0, 6))]
+    return rng.choice([" ", "  ", "  "]).join(words)
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return GuidecomParser()
+
+
+def test_maker_filter_matches_previous_substring_logic(parser):
+    rng = random.Random(20250119)
+    for _ in range(3000):
+        codes = rng.sample(_CODES, rng.randint(0, 3))
+        keyword = rng.choice(_KEYWORDS)
+        matcher = parser._prepare_maker_codes(codes, keyword)
+        for _ in range(5):
+            name = _random_name(rng) or "상품"
+            product = Product(name=name, price="1,000원", specifications="")
+            # Product가 공백을 정리하므로 기준 구현에도 같은 이름을 넘김
+            expected = _old_filter_by_maker(product.name, codes, keyword)
+            assert parser._filter_by_maker(product, matcher) == expected, (codes, keyword, product.name)
+
+
+def test_maker_filter_without_codes_passes_everything(parser):
+    assert parser._prepare_maker_codes([], "삼성 ssd") is None
+    product = Product(name="아무 상품", price="1,000원", specifications="")
+    assert parser._filter_by_maker(product, None)
+
+
+def test_extract_manufacturer_matches_previous_logic():
+    rng = random.Random(7)
+    for _ in range(5000):
+        name = _random_name(rng)
+        assert _extract_manufacturer_name(name) == _old_extract_manufacturer(name), name
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("8월 신제품 삼성전자 990 EVO", "삼성전자"),
+    ("[특가] WD Blue SN580", "WD"),
+    ("무료배송 western digital red", "western digital"),
+    ("Seagate 바라쿠다", "Seagate"),
+    ("박스 정품", None),
+])
+def test_extract_manufacturer_examples(name, expected):
+    assert _extract_manufacturer_name(name) == expected